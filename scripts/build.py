@@ -6,8 +6,7 @@ from pathlib import Path
 from utils import (
     BASE_DIR,
     PKG_DIR,
-    compile_resources,
-    generate_qml_module_artifacts,
+    prepare_resources,
 )
 
 
@@ -27,14 +26,15 @@ def build_parser() -> argparse.ArgumentParser:
 def _build_args(target: str) -> list[str | Path]:
     """Return the Nuitka command arguments for the selected target."""
     args: list[str | Path] = [
-        "uv",
-        "run",
-        "python",
+        sys.executable,
         "-m",
         "nuitka",
         f"--output-dir={BASE_DIR / 'dist'}",
         "--include-data-files=src/slide_voice_pptx/resources/narration-icon.png=slide_voice_pptx/resources/narration-icon.png",
         f"--output-filename=slide-voice-{target}",
+        "--lto=yes",
+        # Drops asserts; docstrings stay as argparse and Qt may read them
+        "--python-flag=-O",
     ]
 
     if target == "app":
@@ -55,9 +55,9 @@ def _build_args(target: str) -> list[str | Path]:
 
 def run_build(target: str = "app"):
     """Build the selected target using Nuitka."""
+    # The bundled app never reads qmltypes, so skip tooling-only codegen
     if target == "app":
-        generate_qml_module_artifacts()
-        compile_resources()
+        prepare_resources(module_types=False)
 
     try:
         _ = subprocess.run(_build_args(target), check=True)
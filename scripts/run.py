@@ -2,17 +2,15 @@ import subprocess
 import sys
 
 from utils import (
-    compile_resources,
-    generate_qml_module_artifacts,
+    prepare_resources,
 )
 
 
 def run_dev():
     """Runs the application."""
     try:
-        generate_qml_module_artifacts()
-        compile_resources()
-        _ = subprocess.run(["uv", "run", "-m", "slide_voice_app"], check=True)
+        prepare_resources()
+        _ = subprocess.run([sys.executable, "-m", "slide_voice_app"], check=True)
     except subprocess.CalledProcessError as e:
         print(f"Running application failed: {e}")
         sys.exit(1)
@@ -1,10 +1,16 @@
+import hashlib
 import subprocess
 import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 PKG_DIR = BASE_DIR / "src" / "slide_voice_app"
+# Scripts are launched through `uv run`, so the interpreter already lives in
+# the synced project environment and its tools sit next to it.
+VENV_BIN = Path(sys.executable).parent
 
 
 @dataclass(frozen=True)
@@ -27,25 +33,74 @@ QML_MODULE_SPECS: list[QmlModuleSpec] = [
 ]
 
 
-def compile_resources() -> None:
-    """Runs the pyside6-rcc compiler via uv."""
+def _stamp_path(output: Path) -> Path:
+    return output.with_suffix(f"{output.suffix}.stamp")
+
+
+def _inputs_digest(inputs: list[Path]) -> str:
+    """Hash input paths with their modification time and size."""
+    digest = hashlib.blake2b()
+
+    for path in sorted(inputs):
+        stat = path.stat()
+        digest.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+
+    return digest.hexdigest()
+
+
+def _should_regenerate(output: Path, inputs: list[Path]) -> bool:
+    """Return whether an output is missing or its inputs changed since generation."""
+    stamp = _stamp_path(output)
+
+    if not output.exists() or not stamp.exists():
+        return True
+
+    return stamp.read_text() != _inputs_digest(inputs)
+
+
+def _write_stamp(output: Path, inputs: list[Path]) -> None:
+    """Record the inputs an output was generated from."""
+    _stamp_path(output).write_text(_inputs_digest(inputs))
+
+
+def _run_tool(args: list[str | Path], error_message: str) -> None:
+    """Run a tool subprocess, printing its captured output only on failure.
+
+    Output is captured so tools running concurrently do not interleave.
+    """
     try:
-        _ = subprocess.run(
-            [
-                "uv",
-                "run",
-                "pyside6-rcc",
-                str(PKG_DIR / "resources.qrc"),
-                "-o",
-                str(PKG_DIR / "rc_resources.py"),
-            ],
-            check=True,
-        )
+        _ = subprocess.run(args, check=True, capture_output=True, text=True)
     except subprocess.CalledProcessError as e:
-        print(f"Error compiling resources: {e}")
+        print(f"{error_message}: {e}\n{e.stdout}{e.stderr}")
         sys.exit(1)
 
 
+def compile_resources() -> None:
+    """Runs the pyside6-rcc compiler from the project environment.
+
+    Skipped when `resources.qrc` and the files it references are unchanged
+    since the last compilation.
+    """
+    qrc_path = PKG_DIR / "resources.qrc"
+    output_path = PKG_DIR / "rc_resources.py"
+    inputs = [
+        qrc_path,
+        *(
+            PKG_DIR / (file.text or "")
+            for file in ET.parse(qrc_path).getroot().iter("file")
+        ),
+    ]
+
+    if not _should_regenerate(output_path, inputs):
+        return
+
+    _run_tool(
+        [VENV_BIN / "pyside6-rcc", qrc_path, "-o", output_path],
+        "Error compiling resources",
+    )
+    _write_stamp(output_path, inputs)
+
+
 def _generate_qml_module_artifacts(spec: QmlModuleSpec) -> None:
     module_dir = PKG_DIR / "qml_modules" / spec.import_name
 
@@ -53,60 +108,64 @@ def _generate_qml_module_artifacts(spec: QmlModuleSpec) -> None:
         if not (module_dir / source_file).exists():
             raise FileNotFoundError(f"QML module source file not found: {source_file}")
 
-    qmldir_path = module_dir / "qmldir"
     metatypes_path = module_dir / "modulemetatypes.json"
     qmltypes_path = module_dir / "module.qmltypes"
     registrations_path = module_dir / "module_qmltyperegistrations.cpp"
+    source_paths = [module_dir / path for path in spec.source_files]
+
+    if not _should_regenerate(qmltypes_path, source_paths):
+        return
+
+    _run_tool(
+        [
+            VENV_BIN / "pyside6-metaobjectdump",
+            "-o",
+            metatypes_path,
+            *source_paths,
+        ],
+        f"Error generating metatypes for {spec.import_name}",
+    )
+    _run_tool(
+        [
+            VENV_BIN / "pyside6-qmltyperegistrar",
+            "--generate-qmltypes",
+            qmltypes_path,
+            "-o",
+            registrations_path,
+            metatypes_path,
+            "--import-name",
+            spec.import_name,
+            "--major-version",
+            str(spec.major_version),
+            "--minor-version",
+            str(spec.minor_version),
+        ],
+        f"Error generating qmltypes for {spec.import_name}",
+    )
+    _write_stamp(qmltypes_path, source_paths)
 
-    qmldir_path.write_text(f"module {spec.import_name}\ntypeinfo module.qmltypes")
 
-    try:
-        _ = subprocess.run(
-            [
-                "uv",
-                "run",
-                "pyside6-metaobjectdump",
-                "-o",
-                metatypes_path,
-                *[(module_dir / path) for path in spec.source_files],
-            ],
-            check=True,
-        )
-    except subprocess.CalledProcessError as e:
-        print(f"Error generating metatypes for {spec.import_name}: {e}")
-        sys.exit(1)
+def generate_qml_module_artifacts() -> None:
+    """Generate qmltypes and registration artifacts for QML modules.
 
-    try:
-        _ = subprocess.run(
-            [
-                "uv",
-                "run",
-                "pyside6-qmltyperegistrar",
-                "--generate-qmltypes",
-                str(qmltypes_path),
-                "-o",
-                str(registrations_path),
-                str(metatypes_path),
-                "--import-name",
-                spec.import_name,
-                "--major-version",
-                str(spec.major_version),
-                "--minor-version",
-                str(spec.minor_version),
-            ],
-            check=True,
-        )
-    except subprocess.CalledProcessError as e:
-        print(f"Error generating qmltypes for {spec.import_name}: {e}")
-        sys.exit(1)
+    The `qmldir` of each module is committed. Types register at import time
+    through `QmlElement`, so these artifacts only serve QML tooling.
+    """
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(_generate_qml_module_artifacts, QML_MODULE_SPECS))
 
 
-def generate_qml_module_artifacts() -> None:
-    """Generate qmltypes and registration artifacts for QML modules."""
-    for spec in QML_MODULE_SPECS:
-        _generate_qml_module_artifacts(spec)
+def prepare_resources(module_types: bool = True) -> None:
+    """Generate QML module artifacts, then compile resources.
 
+    Args:
+        module_types: Whether to generate qmltypes for QML tooling.
+    """
+    if module_types:
+        generate_qml_module_artifacts()
 
-if __name__ == "__main__":
-    generate_qml_module_artifacts()
     compile_resources()
+
+
+if __name__ == "__main__":
+    prepare_resources()
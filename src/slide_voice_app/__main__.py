@@ -5,7 +5,6 @@ from PySide6.QtCore import QCoreApplication, QSettings
 from PySide6.QtGui import QGuiApplication
 from PySide6.QtQml import QQmlApplicationEngine
 
-import slide_voice_app.qml_modules.SlideVoiceApp
 import slide_voice_app.rc_resources  # noqa: F401
 
 
@@ -17,6 +16,9 @@ def main():
     app = QGuiApplication(sys.argv)
     engine = QQmlApplicationEngine()
 
+    # Registers the QML types; only needed once the engine is about to load
+    import slide_voice_app.qml_modules.SlideVoiceApp  # noqa: F401
+
     if platform.system() == "Linux":
         QCoreApplication.addLibraryPath("/usr/lib/qt6/plugins")
         engine.addImportPath("/usr/lib/qt6/qml")
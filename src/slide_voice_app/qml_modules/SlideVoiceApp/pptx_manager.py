@@ -4,16 +4,15 @@ from pathlib import Path
 from urllib.parse import urlparse
 from urllib.request import url2pathname
 
-from PySide6.QtCore import Property, QObject, Signal, Slot
+from PySide6.QtCore import Property, QObject, QThreadPool, Signal, Slot
 from PySide6.QtQml import QmlElement, QmlSingleton
 
 from slide_voice_app.audio_identity import EMBEDDED_AUDIO_BASENAME
 from slide_voice_app.qml_modules.SlideVoiceApp.models import SlidesModel
+from slide_voice_app.qml_modules.SlideVoiceApp.workers import PptxOpenWorker
 from slide_voice_pptx import PptxFile
 from slide_voice_pptx.exceptions import (
     AudioNotFoundError,
-    InvalidPptxError,
-    RelsNotFoundError,
     SlideNotFoundError,
     SlideXmlNotFoundError,
 )
@@ -22,6 +21,11 @@ QML_IMPORT_NAME = "SlideVoiceApp"
 QML_IMPORT_MAJOR_VERSION = 1
 
 
+def _url_to_path(url: str) -> Path:
+    """Convert a QML file URL into a local filesystem path."""
+    return Path(url2pathname(urlparse(url).path))
+
+
 @QmlElement
 @QmlSingleton
 class PPTXManager(QObject):
@@ -37,6 +41,8 @@ class PPTXManager(QObject):
         super().__init__(parent)
         self._pptx_file: PptxFile | None = None
         self._current_slide_index = -1
+        self._is_opening = False
+        self._thread_pool = QThreadPool.globalInstance()
         self._slides_model = SlidesModel(self)
         self._slides_model.modelReset.connect(self._emit_current_slide_state)
         self._slides_model.dataChanged.connect(self._on_slides_data_changed)
@@ -121,33 +127,33 @@ class PPTXManager(QObject):
         value = self._slides_model.data(index, SlidesModel.Role.HasEmbeddedAudio)
         return bool(value)
 
+    def _on_file_opened(self, pptx_file: PptxFile):
+        """Handle successful file open."""
+        self._is_opening = False
+        self._pptx_file = pptx_file
+        self._slides_model.setPptxFile(self._pptx_file)
+        self.fileLoadedChanged.emit()
+        self.setCurrentSlideIndex(0)
+
+    def _on_open_error(self, error_msg: str):
+        """Handle file open error."""
+        self._is_opening = False
+        self.errorOccurred.emit(error_msg)
+
     @Slot(str)
     def openFile(self, file_url: str):
-        """Open a PPTX file and load its slide notes."""
-        path = Path(url2pathname(urlparse(file_url).path))
+        """Open a PPTX file and load its slide notes in the background."""
+        if self._is_opening:
+            self.errorOccurred.emit("A file is already opening")
+            return
 
         self._unload_file()
-
-        try:
-            self._pptx_file = PptxFile.open(path)
-            self._slides_model.setPptxFile(self._pptx_file)
-            self.fileLoadedChanged.emit()
-            self.setCurrentSlideIndex(0)
-        except FileNotFoundError:
-            self._unload_file()
-            self.errorOccurred.emit(f"File not found: {path}")
-        except InvalidPptxError as e:
-            self._unload_file()
-            self.errorOccurred.emit(str(e))
-        except RelsNotFoundError as e:
-            self._unload_file()
-            self.errorOccurred.emit(str(e))
-        except SlideXmlNotFoundError as e:
-            self._unload_file()
-            self.errorOccurred.emit(str(e))
-        except Exception as e:
-            self._unload_file()
-            self.errorOccurred.emit(f"Failed to open file: {e}")
+        self._is_opening = True
+        # Extraction and slide parsing would otherwise block the GUI thread
+        worker = PptxOpenWorker(_url_to_path(file_url))
+        worker.signals.finished.connect(self._on_file_opened)
+        worker.signals.error.connect(self._on_open_error)
+        self._thread_pool.start(worker)
 
     @Slot(str)
     def saveAudioForCurrentSlide(self, mp3_file_url: str):
@@ -165,7 +171,7 @@ class PPTXManager(QObject):
             return
 
         try:
-            mp3_path = Path(url2pathname(urlparse(mp3_file_url).path))
+            mp3_path = _url_to_path(mp3_file_url)
             self._pptx_file.save_audio_for_slide(self._current_slide_index, mp3_path)
             self._emit_current_slide_state()
         except FileNotFoundError as e:
@@ -214,7 +220,7 @@ class PPTXManager(QObject):
             return
 
         try:
-            output_path = Path(url2pathname(urlparse(output_file_url).path))
+            output_path = _url_to_path(output_file_url)
             self._pptx_file.export_to(output_path)
         except Exception as e:
             self.errorOccurred.emit(f"Failed to export file: {e}")
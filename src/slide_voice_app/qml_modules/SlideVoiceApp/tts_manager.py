@@ -8,6 +8,7 @@ from PySide6.QtCore import (
     QSettings,
     QStandardPaths,
     QThreadPool,
+    QUrl,
     Signal,
     Slot,
 )
@@ -51,6 +52,7 @@ class TTSManager(QObject):
         self._current_provider_id: str = ""
         self._provider_info: dict[str, ProviderInfo] = {}
         self._provider_classes: dict[str, type[TTSProvider]] = {}
+        self._applied_settings: dict[str, dict[str, str]] = {}
 
         for provider_class in PROVIDER_REGISTRY:
             info = provider_class.get_provider_info()
@@ -60,6 +62,10 @@ class TTSManager(QObject):
         self._is_fetching_voices = False
         self._is_generating = False
         self._has_generated_audio = False
+        self._output_file_path: str | None = None
+        # (provider, voice, language, text) of the audio in the output file
+        self._generated_key: tuple[str, str, str, str] | None = None
+        self._generating_key: tuple[str, str, str, str] | None = None
 
         self._providers_model = ProvidersModel(self)
         self._providers_model.setProviders(list(self._provider_info.values()))
@@ -100,12 +106,16 @@ class TTSManager(QObject):
 
     def _get_output_file_path(self) -> str:
         """Get the path to the generated audio output file."""
-        temp_location = QStandardPaths.writableLocation(
-            QStandardPaths.StandardLocation.TempLocation
-        )
-        temp_dir = Path(temp_location) / "slide-voice-app"
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        return str(temp_dir / EMBEDDED_AUDIO_FILENAME)
+        # Resolved once; providers recreate the directory before writing
+        if self._output_file_path is None:
+            temp_location = QStandardPaths.writableLocation(
+                QStandardPaths.StandardLocation.TempLocation
+            )
+            temp_dir = Path(temp_location) / "slide-voice-app"
+            temp_dir.mkdir(parents=True, exist_ok=True)
+            self._output_file_path = str(temp_dir / EMBEDDED_AUDIO_FILENAME)
+
+        return self._output_file_path
 
     @Property(str, constant=True)
     def outputFile(self) -> str:
@@ -177,9 +187,20 @@ class TTSManager(QObject):
         if not self._is_provider(provider_id):
             return
 
-        provider = self._provider_for(provider_id)
         settings = self._get_provider_setting_values(provider_id)
+
+        # Re-selecting the same provider with the same settings, such as when
+        # the settings window closes, has nothing to refetch unless it failed
+        if (
+            provider_id == self._current_provider_id
+            and settings == self._applied_settings.get(provider_id)
+            and (self._is_fetching_voices or self._voices_model.rowCount() > 0)
+        ):
+            return
+
+        provider = self._provider_for(provider_id)
         provider.configure(settings)
+        self._applied_settings[provider_id] = settings
 
         changed = self._current_provider_id != provider_id
         self._current_provider_id = provider_id
@@ -205,21 +226,17 @@ class TTSManager(QObject):
         info = self._provider_info.get(provider_id)
         assert info is not None
 
-        settings = []
-
-        for setting in info.settings:
-            settings_key = self._settings_key(provider_id, setting.key)
-            settings.append(
-                {
-                    "key": settings_key,
-                    "label": setting.label,
-                    "type": setting.setting_type.value,
-                    "placeholder": setting.placeholder,
-                    "value": self._settings.value(settings_key, ""),
-                }
-            )
-
-        return settings
+        values = self._get_provider_setting_values(provider_id)
+        return [
+            {
+                "key": self._settings_key(provider_id, setting.key),
+                "label": setting.label,
+                "type": setting.setting_type.value,
+                "placeholder": setting.placeholder,
+                "value": values[setting.key],
+            }
+            for setting in info.settings
+        ]
 
     def _on_voices_fetched(self, voices: list[Voice]):
         """Handle successful voice fetch."""
@@ -275,10 +292,20 @@ class TTSManager(QObject):
         if not self._can_generate_audio(text, voice_id):
             return False
 
+        output_path = Path(self._get_output_file_path())
+        key = (self._current_provider_id, voice_id, language_code, text)
+
+        # Unchanged input would synthesize the same audio, so replay the file
+        if key == self._generated_key and output_path.exists():
+            self.setHasGeneratedAudio(True)
+            self.playAudio(str(output_path))
+            return True
+
         self.setHasGeneratedAudio(False)
+        self._generated_key = None
+        self._generating_key = key
         self._is_generating = True
         self.isGeneratingChanged.emit()
-        output_path = Path(self._get_output_file_path())
         provider = self._provider_for(self._current_provider_id)
         worker = AudioGenerateWorker(
             provider, text, voice_id, language_code, output_path
@@ -296,6 +323,7 @@ class TTSManager(QObject):
     def _on_audio_generated(self, file_path: str):
         """Handle successful audio generation."""
         self._is_generating = False
+        self._generated_key = self._generating_key
         self.isGeneratingChanged.emit()
         self.setHasGeneratedAudio(True)
         self.playAudio(file_path)
@@ -313,8 +341,9 @@ class TTSManager(QObject):
             self.errorOccurred.emit("No audio file to play")
             return
 
-        self._media_player.setSource("")
-        self._media_player.setSource(file_path)
+        # Clear first so regenerated audio at the same path is reloaded
+        self._media_player.setSource(QUrl())
+        self._media_player.setSource(QUrl.fromLocalFile(file_path))
         self._media_player.play()
 
     @Slot()
@@ -1,10 +1,16 @@
-"""TTS Workers for background tasks."""
+"""Workers for background tasks."""
 
 from pathlib import Path
 
 from PySide6.QtCore import QObject, QRunnable, Signal
 
 from slide_voice_app.tts.provider import TTSProvider
+from slide_voice_pptx import PptxFile
+from slide_voice_pptx.exceptions import (
+    InvalidPptxError,
+    RelsNotFoundError,
+    SlideXmlNotFoundError,
+)
 
 
 class BaseWorkerSignals(QObject):
@@ -87,3 +93,36 @@ class AudioGenerateWorker(BaseWorker):
             self.text, self.voice_id, self.language_code, self.output_path
         )
         self.signals.finished.emit(str(result_path))
+
+
+class PptxOpenWorkerSignals(BaseWorkerSignals):
+    """Signals for PptxOpenWorker."""
+
+    # PptxFile
+    finished = Signal(object)
+
+
+class PptxOpenWorker(BaseWorker):
+    """Worker to open and load a PPTX file in a background thread."""
+
+    def __init__(self, path: Path):
+        signals = PptxOpenWorkerSignals()
+        super().__init__(signals)
+        self.path = path
+        self.signals: PptxOpenWorkerSignals = signals
+
+    def work(self):
+        """Extract the PPTX file and load its slides."""
+        try:
+            pptx_file = PptxFile.open(self.path)
+        except FileNotFoundError:
+            self.signals.error.emit(f"File not found: {self.path}")
+            return
+        except (InvalidPptxError, RelsNotFoundError, SlideXmlNotFoundError) as e:
+            self.signals.error.emit(str(e))
+            return
+        except Exception as e:
+            self.signals.error.emit(f"Failed to open file: {e}")
+            return
+
+        self.signals.finished.emit(pptx_file)
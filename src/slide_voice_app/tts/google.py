@@ -1,8 +1,10 @@
 """Google Cloud Text-to-Speech provider implementation."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
-
-from google.cloud import texttospeech
+from typing import TYPE_CHECKING
 
 from slide_voice_app.tts.provider import (
     ProviderInfo,
@@ -13,6 +15,29 @@ from slide_voice_app.tts.provider import (
 )
 from slide_voice_app.tts.ssml import SSMLProcessor
 
+# The client library pulls in gRPC and protobuf, so it is imported on first use
+# inside worker threads rather than while the UI starts.
+if TYPE_CHECKING:
+    from google.cloud import texttospeech
+
+# Voice lists change rarely, and every provider switch or settings save refetches
+VOICES_CACHE_TTL_SECONDS = 600
+# synthesize_speech rejects SSML input larger than this
+MAX_SSML_BYTES = 5000
+MAX_PARALLEL_REQUESTS = 4
+
+
+@cache
+def _gender_names() -> dict[int, str]:
+    """Map SsmlVoiceGender values to display names, built on first use."""
+    from google.cloud import texttospeech
+
+    return {
+        texttospeech.SsmlVoiceGender.MALE: "Male",
+        texttospeech.SsmlVoiceGender.FEMALE: "Female",
+        texttospeech.SsmlVoiceGender.NEUTRAL: "Neutral",
+    }
+
 
 class GoogleTTSProvider(TTSProvider):
     """Google Cloud Text-to-Speech provider.
@@ -27,6 +52,7 @@ class GoogleTTSProvider(TTSProvider):
         """Initialize the Google TTS provider."""
         self._api_key: str | None = None
         self._client: texttospeech.TextToSpeechClient | None = None
+        self._voices_cache: tuple[float, list[Voice]] | None = None
 
     @classmethod
     def get_provider_info(cls) -> ProviderInfo:
@@ -53,16 +79,16 @@ class GoogleTTSProvider(TTSProvider):
         Args:
             settings: Dictionary with optional 'api_key' key.
         """
-        api_key = settings.get("api_key", "")
+        api_key = settings.get("api_key", "") or None
 
-        if api_key:
-            self._api_key = api_key
-        else:
-            self._api_key = None
+        # Keep the client and its open channel unless the credentials change
+        if api_key != self._api_key:
+            self._client = None
+            self._voices_cache = None
 
-        self._client = None
+        self._api_key = api_key
 
-    def _get_client(self) -> texttospeech.TextToSpeechClient:
+    def _get_client(self) -> "texttospeech.TextToSpeechClient":
         """Get or create the TTS client.
 
         Returns:
@@ -72,6 +98,8 @@ class GoogleTTSProvider(TTSProvider):
             google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport creation failed for any reason.
         """
         if self._client is None:
+            from google.cloud import texttospeech
+
             if self._api_key:
                 self._client = texttospeech.TextToSpeechClient(
                     client_options={"api_key": self._api_key}
@@ -85,22 +113,26 @@ class GoogleTTSProvider(TTSProvider):
     def list_voices(self) -> list[Voice]:
         """List available voices from Google Cloud TTS.
 
+        Results are cached per API key for `VOICES_CACHE_TTL_SECONDS`.
+
         Returns:
             A list of Voice objects.
 
         Raises:
             Exception: If the API call fails.
         """
+        if self._voices_cache is not None:
+            fetched_at, cached_voices = self._voices_cache
+
+            if time.monotonic() - fetched_at < VOICES_CACHE_TTL_SECONDS:
+                return list(cached_voices)
+
         voices: list[Voice] = []
-        gender_map = {
-            texttospeech.SsmlVoiceGender.MALE: "Male",
-            texttospeech.SsmlVoiceGender.FEMALE: "Female",
-            texttospeech.SsmlVoiceGender.NEUTRAL: "Neutral",
-        }
+        gender_names = _gender_names()
 
         for voice in self._get_client().list_voices().voices:
             language_code = voice.language_codes[0] if voice.language_codes else ""
-            gender = gender_map.get(voice.ssml_gender, "Unknown")
+            gender = gender_names.get(voice.ssml_gender, "Unknown")
             voices.append(
                 Voice(
                     voice.name,
@@ -110,13 +142,19 @@ class GoogleTTSProvider(TTSProvider):
                 )
             )
 
-        return voices
+        self._voices_cache = (time.monotonic(), voices)
+        return list(voices)
 
     def generate_audio(
         self, text: str, voice_id: str, language_code: str, output_path: Path
     ) -> Path:
         """Generate audio from text using Google Cloud TTS.
 
+        Text over the API's SSML size limit is split between paragraphs. The
+        parts are synthesized concurrently and their MP3 streams joined in
+        text order. A single paragraph is never split, so one whose SSML alone
+        exceeds the limit is rejected before any request is sent.
+
         Args:
             text: The text to convert to speech.
             voice_id: The voice name/ID to use (e.g., "en-US-Wavenet-A").
@@ -126,10 +164,22 @@ class GoogleTTSProvider(TTSProvider):
             The path to the generated audio file.
 
         Raises:
+            ValueError: If a paragraph is too long for one API request.
             Exception: If the API call fails.
         """
-        ssml_text = SSMLProcessor.to_ssml(text)
-        synthesis_input = texttospeech.SynthesisInput(ssml=ssml_text)
+        from google.cloud import texttospeech
+
+        ssml_chunks = SSMLProcessor.to_ssml_chunks(text, MAX_SSML_BYTES)
+
+        for ssml_text in ssml_chunks:
+            ssml_size = len(ssml_text.encode())
+
+            if ssml_size > MAX_SSML_BYTES:
+                raise ValueError(
+                    f"Paragraph is too long to synthesize: {ssml_size} bytes of "
+                    f"SSML exceeds the {MAX_SSML_BYTES} byte limit"
+                )
+
         voice_params = texttospeech.VoiceSelectionParams(
             language_code=language_code,
             name=voice_id,
@@ -137,14 +187,28 @@ class GoogleTTSProvider(TTSProvider):
         audio_config = texttospeech.AudioConfig(
             audio_encoding=texttospeech.AudioEncoding.MP3
         )
-        response = self._get_client().synthesize_speech(
-            input=synthesis_input,
-            voice=voice_params,
-            audio_config=audio_config,
-        )
+        client = self._get_client()
+
+        def synthesize(ssml_text: str) -> bytes:
+            response = client.synthesize_speech(
+                input=texttospeech.SynthesisInput(ssml=ssml_text),
+                voice=voice_params,
+                audio_config=audio_config,
+            )
+            return response.audio_content
+
+        if len(ssml_chunks) == 1:
+            audio_parts = [synthesize(ssml_chunks[0])]
+        else:
+            # MP3 frames from the same voice and config can be concatenated
+            with ThreadPoolExecutor(
+                max_workers=min(len(ssml_chunks), MAX_PARALLEL_REQUESTS)
+            ) as executor:
+                audio_parts = list(executor.map(synthesize, ssml_chunks))
+
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(output_path, "wb") as out:
-            out.write(response.audio_content)
+            out.writelines(audio_parts)
 
         return output_path
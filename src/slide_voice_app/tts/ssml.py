@@ -3,7 +3,6 @@
 import re
 from abc import ABC, abstractmethod
 from re import Match
-from xml.sax.saxutils import escape
 
 from typing_extensions import override
 
@@ -54,11 +53,19 @@ class BreakRule(SSMLRule):
     """Convert tilde runs surrounded by spaces to <break> tags."""
 
     _pattern = re.compile(r"(?<!\S)~+(?!\S)")
+    # Tags for the run lengths people actually type, formatted once
+    _tags = tuple(f'<break time="{count * 0.5}s"/>' for count in range(32))
 
     @override
     @classmethod
     def _replacement(cls, match: Match[str]) -> str:
-        return f'<break time="{len(match.group(0)) * 0.5}s"/>'
+        # The run length comes from the span, without slicing out the match
+        count = match.end() - match.start()
+
+        if count < len(cls._tags):
+            return cls._tags[count]
+
+        return f'<break time="{count * 0.5}s"/>'
 
 
 class EmphasisRule(SSMLRule):
@@ -77,6 +84,33 @@ class SSMLProcessor:
 
     # Apply voice rule last as it removes new line character after content
     _rules: list[type[SSMLRule]] = [BreakRule, EmphasisRule, VoiceRule]
+    # One translate pass instead of saxutils.escape's chain of replace calls
+    _escape_table = str.maketrans(
+        {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}
+    )
+    # Characters that escaping or any rule acts on
+    _trigger_chars = frozenset('&<>"~_[')
+
+    @classmethod
+    def _apply_rules(cls, text: str) -> str:
+        """Escape text and apply every rule without the <speak> wrapper.
+
+        Args:
+            text: The input text with custom syntax.
+
+        Returns:
+            The SSML body.
+        """
+        # Plain text has nothing to escape or match, so skip every pass
+        if cls._trigger_chars.isdisjoint(text):
+            return text
+
+        escaped = text.translate(cls._escape_table)
+
+        for rule in cls._rules:
+            escaped = rule.apply(escaped)
+
+        return escaped
 
     @classmethod
     def to_ssml(cls, text: str) -> str:
@@ -88,9 +122,41 @@ class SSMLProcessor:
         Returns:
             The SSML-formatted text.
         """
-        escaped = escape(text, {'"': "&quot;"})
+        return f"<speak>{cls._apply_rules(text)}</speak>"
 
-        for rule in cls._rules:
-            escaped = rule.apply(escaped)
+    @classmethod
+    def to_ssml_chunks(cls, text: str, max_bytes: int) -> list[str]:
+        """Convert custom syntax to SSML documents within a size limit.
 
-        return f"<speak>{escaped}</speak>"
+        Rules only match within a paragraph, so paragraphs are converted one at
+        a time and grouped greedily. A paragraph is never split, so one that is
+        larger than the limit becomes a document of its own.
+
+        Args:
+            text: The input text with custom syntax.
+            max_bytes: Maximum UTF-8 size of each document, including tags.
+
+        Returns:
+            SSML documents wrapped in <speak> tags, in text order.
+        """
+        wrapper_size = len("<speak></speak>")
+        groups: list[list[str]] = [[]]
+        size = wrapper_size
+
+        for paragraph in text.split("\n"):
+            body = cls._apply_rules(paragraph)
+            body_size = len(body.encode())
+            current = groups[-1]
+
+            # Each paragraph after the first is joined by a newline
+            if current and size + 1 + body_size > max_bytes:
+                current = []
+                groups.append(current)
+                size = wrapper_size
+            elif current:
+                size += 1
+
+            current.append(body)
+            size += body_size
+
+        return ["<speak>" + "\n".join(group) + "</speak>" for group in groups]
@@ -1,5 +1,6 @@
 """Slide audio delete helpers."""
 
+import os
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
@@ -24,7 +25,7 @@ from ..xpath import (
     XPATH_PIC_BLIP,
     XPATH_PIC_CNVPR,
     XPATH_PIC_MEDIA,
-    XPATH_RELATIONSHIP_BY_ID,
+    XPATH_RELATIONSHIP_WITH_ID,
 )
 from .audio_read import load_slide_audio
 
@@ -171,19 +172,24 @@ def _slides_use_target(work_dir: Path, target_path: str) -> bool:
     Returns:
         True when at least one slide relationship still resolves to the target path.
     """
-    slides_rels_dir = work_dir / "ppt/slides/_rels"
+    slides_rels_dir = "ppt/slides/_rels"
 
-    if not slides_rels_dir.exists():
+    try:
+        entries = os.scandir(work_dir / slides_rels_dir)
+    except FileNotFoundError:
         return False
 
-    for rels_path in slides_rels_dir.glob("*.rels"):
-        rels_part_path = rels_path.relative_to(work_dir).as_posix()
-        source_path = source_path_for_rels_path(rels_part_path)
-        rels_root = ET.fromstring(rels_path.read_bytes())
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".rels"):
+                continue
 
-        for target in get_relationship_id_target_map(rels_root).values():
-            if resolve_target_path(source_path, target) == target_path:
-                return True
+            source_path = source_path_for_rels_path(f"{slides_rels_dir}/{entry.name}")
+            rels_root = ET.parse(entry.path).getroot()
+
+            for target in get_relationship_id_target_map(rels_root).values():
+                if resolve_target_path(source_path, target) == target_path:
+                    return True
 
     return False
 
@@ -214,7 +220,7 @@ def delete_slide_audio(work_dir: Path, slide_path: str, name: str) -> None:
     if not slide_file.exists():
         raise SlideXmlNotFoundError(slide_path)
 
-    slide_root = ET.fromstring(slide_file.read_bytes())
+    slide_root = ET.parse(slide_file).getroot()
     parent_map = {child: parent for parent in slide_root.iter() for child in parent}
 
     for pic in slide_root.findall(XPATH_P_PIC, namespaces=NSMAP):
@@ -233,16 +239,14 @@ def delete_slide_audio(work_dir: Path, slide_path: str, name: str) -> None:
     _remove_audio_nodes_with_spid_target(slide_root, spid)
     _remove_empty_timing(slide_root)
 
-    slide_file.write_bytes(
-        ET.tostring(slide_root, encoding="UTF-8", xml_declaration=True)
-    )
+    ET.ElementTree(slide_root).write(slide_file, encoding="UTF-8", xml_declaration=True)
 
     rels_file = slide_rels_path(work_dir, slide_path)
 
     if not rels_file.exists():
         return
 
-    rels_root = ET.fromstring(rels_file.read_bytes())
+    rels_root = ET.parse(rels_file).getroot()
     ids_to_remove = {
         rid
         for rid in (audio.audio_rid, audio.media_rid, audio.image_rid)
@@ -252,16 +256,13 @@ def delete_slide_audio(work_dir: Path, slide_path: str, name: str) -> None:
         rels_root, only_ids=ids_to_remove
     ).values()
 
-    for rid in ids_to_remove:
-        for relationship in rels_root.findall(
-            XPATH_RELATIONSHIP_BY_ID.format(rid=rid),
-            namespaces=NSMAP_RELS,
-        ):
+    for relationship in rels_root.findall(
+        XPATH_RELATIONSHIP_WITH_ID, namespaces=NSMAP_RELS
+    ):
+        if relationship.get("Id") in ids_to_remove:
             rels_root.remove(relationship)
 
-    rels_file.write_bytes(
-        ET.tostring(rels_root, encoding="UTF-8", xml_declaration=True)
-    )
+    ET.ElementTree(rels_root).write(rels_file, encoding="UTF-8", xml_declaration=True)
     media_dir = work_dir / "ppt/media"
 
     for target in targets_to_check:
@@ -1,11 +1,14 @@
 """Insert audio into PPTX slides with autoplay on slide start."""
 
 import hashlib
+import os
 import re
+import shutil
 import uuid
 import xml.etree.ElementTree as ET
 from importlib.resources import files
 from pathlib import Path
+from xml.sax.saxutils import escape
 
 from ..content_types import ensure_content_type_defaults
 from ..exceptions import SlideXmlNotFoundError
@@ -23,92 +26,150 @@ from ..namespaces import (
 from ..paths import slide_rels_path
 from ..rels import add_relationship, find_relationship_by_type_and_target
 from .audio_timing import (
+    TimingIdAllocator,
     compute_next_delay,
     create_audio_node,
     create_command_node,
-    get_next_shape_id,
-    get_next_timing_id,
     get_or_create_audio_parent,
     get_or_create_command_parent,
     get_or_create_pic_parent,
+    scan_slide_ids,
 )
 
+# The default namespace differs between part types and is registered per write
+for _prefix, _uri in (
+    ("p", NAMESPACE_P),
+    ("a", NAMESPACE_A),
+    ("r", NAMESPACE_R),
+    ("p14", NAMESPACE_P14),
+    ("a16", NAMESPACE_A16),
+):
+    ET.register_namespace(_prefix, _uri)
+
 DEFAULT_ICON_X = 12479915
 DEFAULT_ICON_Y = -126134
 DEFAULT_ICON_CX = 812800
 DEFAULT_ICON_CY = 812800
 
+# Media dedup only needs content identity. hashlib's OpenSSL-backed SHA-256
+# uses the CPU's SHA extensions where available.
+MEDIA_HASH_ALGORITHM = "sha256"
+
+MEDIA_MP3_PATTERN = re.compile(r"^media(\d+)\.mp3$")
+IMAGE_PNG_PATTERN = re.compile(r"^image(\d+)\.png$")
+
+_PIC_TEMPLATE = (
+    f'<p:pic xmlns:p="{NAMESPACE_P}" xmlns:a="{NAMESPACE_A}" xmlns:r="{NAMESPACE_R}" '
+    f'xmlns:p14="{NAMESPACE_P14}" xmlns:a16="{NAMESPACE_A16}">'
+    "<p:nvPicPr>"
+    '<p:cNvPr id="{spid}" name="{name}">'
+    '<a:hlinkClick r:id="" action="ppaction://media"/>'
+    '<a:extLst><a:ext uri="{{FF2B5EF4-FFF2-40B4-BE49-F238E27FC236}}">'
+    '<a16:creationId id="{{{creation_id}}}"/>'
+    "</a:ext></a:extLst>"
+    "</p:cNvPr>"
+    '<p:cNvPicPr><a:picLocks noChangeAspect="1"/></p:cNvPicPr>'
+    "<p:nvPr>"
+    '<a:audioFile r:link="{audio_rid}"/>'
+    '<p:extLst><p:ext uri="{{DAA4B4D4-6D71-4841-9C94-3DE7FCFB9230}}">'
+    '<p14:media r:embed="{media_rid}"/>'
+    "</p:ext></p:extLst>"
+    "</p:nvPr>"
+    "</p:nvPicPr>"
+    "<p:blipFill>"
+    '<a:blip r:embed="{image_rid}"/><a:stretch><a:fillRect/></a:stretch>'
+    "</p:blipFill>"
+    "<p:spPr>"
+    '<a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+    "</p:spPr>"
+    "</p:pic>"
+)
+
 AUDIO_ICON_BYTES = (
     files("slide_voice_pptx").joinpath("resources", "narration-icon.png").read_bytes()
 )
-AUDIO_ICON_HASH = hashlib.sha256(AUDIO_ICON_BYTES).hexdigest()
+AUDIO_ICON_HASH = hashlib.new(MEDIA_HASH_ALGORITHM, AUDIO_ICON_BYTES).hexdigest()
 
 
-def _find_media_files(media_dir: Path, prefix: str, ext: str) -> list[str]:
-    """Find existing media files matching prefix and extension.
+def _file_hash(file_path: Path) -> str:
+    """Hash a file's contents without loading it into memory at once.
+
+    Args:
+        file_path: File to hash.
+
+    Returns:
+        Hex-encoded `MEDIA_HASH_ALGORITHM` digest.
+    """
+    with file_path.open("rb") as file:
+        return hashlib.file_digest(file, MEDIA_HASH_ALGORITHM).hexdigest()
+
+
+def _scan_media_files(
+    media_dir: Path, pattern: re.Pattern[str]
+) -> dict[str, tuple[int, str]]:
+    """Scan existing media files matching a filename pattern in one pass.
 
     Args:
         media_dir: Path to ppt/media directory.
-        prefix: Filename prefix.
-        ext: File extension without dot.
+        pattern: Filename pattern capturing the media number.
 
     Returns:
-        List of filenames, not full paths.
+        Mapping of filename, not full path, to its number and content hash.
     """
-    pattern = re.compile(rf"^{prefix}(\d+)\.{ext}$")
+    media_files: dict[str, tuple[int, str]] = {}
 
-    return [
-        file_path.name
-        for file_path in media_dir.iterdir()
-        if file_path.is_file() and pattern.match(file_path.name)
-    ]
+    # DirEntry.is_file uses the cached readdir type instead of another stat
+    with os.scandir(media_dir) as entries:
+        for entry in entries:
+            if (match := pattern.match(entry.name)) and entry.is_file():
+                media_files[entry.name] = (
+                    int(match.group(1)),
+                    _file_hash(Path(entry.path)),
+                )
 
+    return media_files
 
-def _next_media_filename(existing: list[str], prefix: str, ext: str) -> str:
+
+def _next_media_filename(
+    media_files: dict[str, tuple[int, str]], prefix: str, ext: str
+) -> tuple[int, str]:
     """Allocate next available media filename.
 
     Args:
-        existing: List of existing media filenames.
+        media_files: Scanned media files from `_scan_media_files`.
         prefix: Filename prefix.
         ext: File extension without dot.
 
     Returns:
-        Next available filename like 'media1.mp3'.
+        Next available media number and filename like (1, 'media1.mp3').
     """
-    pattern = re.compile(rf"^{prefix}(\d+)\.{ext}$")
-    max_num = max(
-        [int(match.group(1)) for name in existing if (match := pattern.match(name))],
-        default=0,
-    )
+    next_num = max((num for num, _ in media_files.values()), default=0) + 1
 
-    return f"{prefix}{max_num + 1}.{ext}"
+    return next_num, f"{prefix}{next_num}.{ext}"
 
 
 def _find_existing_media_by_hash(
-    media_dir: Path,
-    existing: list[str],
+    media_files: dict[str, tuple[int, str]],
     target_hash: str,
 ) -> str | None:
     """Find an existing media file with matching hash.
 
     Args:
-        media_dir: Path to ppt/media directory.
-        existing: List of existing media filenames.
-        target_hash: SHA-256 hash to match against.
+        media_files: Scanned media files from `_scan_media_files`.
+        target_hash: Content hash to match against.
 
     Returns:
         Filename if found, None otherwise.
     """
-    for name in existing:
-        file_path = media_dir / name
-
-        if (
-            file_path.exists()
-            and hashlib.sha256(file_path.read_bytes()).hexdigest() == target_hash
-        ):
-            return name
-
-    return None
+    return next(
+        (
+            name
+            for name, (_, file_hash) in media_files.items()
+            if file_hash == target_hash
+        ),
+        None,
+    )
 
 
 def _create_pic_element(
@@ -138,142 +199,43 @@ def _create_pic_element(
     Returns:
         The created p:pic ElementTree element.
     """
-    ET.register_namespace("p", NAMESPACE_P)
-    ET.register_namespace("a", NAMESPACE_A)
-    ET.register_namespace("r", NAMESPACE_R)
-    ET.register_namespace("p14", NAMESPACE_P14)
-    ET.register_namespace("a16", NAMESPACE_A16)
-
-    pic = ET.Element(f"{{{NAMESPACE_P}}}pic")
-
-    nv_pic_pr = ET.SubElement(pic, f"{{{NAMESPACE_P}}}nvPicPr")
-    c_nv_pr = ET.SubElement(
-        nv_pic_pr,
-        f"{{{NAMESPACE_P}}}cNvPr",
-        id=str(spid),
-        name=name,
-    )
-    ET.SubElement(
-        c_nv_pr,
-        f"{{{NAMESPACE_A}}}hlinkClick",
-        {f"{{{NAMESPACE_R}}}id": "", "action": "ppaction://media"},
-    )
-    ext_lst = ET.SubElement(c_nv_pr, f"{{{NAMESPACE_A}}}extLst")
-    ext = ET.SubElement(
-        ext_lst,
-        f"{{{NAMESPACE_A}}}ext",
-        uri="{FF2B5EF4-FFF2-40B4-BE49-F238E27FC236}",
-    )
-    ET.SubElement(
-        ext,
-        f"{{{NAMESPACE_A16}}}creationId",
-        id=f"{{{str(uuid.uuid4()).upper()}}}",
+    return ET.fromstring(
+        _PIC_TEMPLATE.format(
+            spid=spid,
+            name=escape(name, {'"': "&quot;"}),
+            creation_id=str(uuid.uuid4()).upper(),
+            media_rid=media_rid,
+            audio_rid=audio_rid,
+            image_rid=image_rid,
+            x=x,
+            y=y,
+            cx=cx,
+            cy=cy,
+        )
     )
-    c_nv_pic_pr = ET.SubElement(nv_pic_pr, f"{{{NAMESPACE_P}}}cNvPicPr")
-    ET.SubElement(c_nv_pic_pr, f"{{{NAMESPACE_A}}}picLocks", noChangeAspect="1")
-    nv_pr = ET.SubElement(nv_pic_pr, f"{{{NAMESPACE_P}}}nvPr")
-    ET.SubElement(
-        nv_pr,
-        f"{{{NAMESPACE_A}}}audioFile",
-        {f"{{{NAMESPACE_R}}}link": audio_rid},
-    )
-    nv_ext_lst = ET.SubElement(nv_pr, f"{{{NAMESPACE_P}}}extLst")
-    nv_ext = ET.SubElement(
-        nv_ext_lst,
-        f"{{{NAMESPACE_P}}}ext",
-        uri="{DAA4B4D4-6D71-4841-9C94-3DE7FCFB9230}",
-    )
-    ET.SubElement(
-        nv_ext,
-        f"{{{NAMESPACE_P14}}}media",
-        {f"{{{NAMESPACE_R}}}embed": media_rid},
-    )
-
-    blip_fill = ET.SubElement(pic, f"{{{NAMESPACE_P}}}blipFill")
-    ET.SubElement(
-        blip_fill,
-        f"{{{NAMESPACE_A}}}blip",
-        {f"{{{NAMESPACE_R}}}embed": image_rid},
-    )
-    stretch = ET.SubElement(blip_fill, f"{{{NAMESPACE_A}}}stretch")
-    ET.SubElement(stretch, f"{{{NAMESPACE_A}}}fillRect")
-
-    sp_pr = ET.SubElement(pic, f"{{{NAMESPACE_P}}}spPr")
-    xfrm = ET.SubElement(sp_pr, f"{{{NAMESPACE_A}}}xfrm")
-    ET.SubElement(xfrm, f"{{{NAMESPACE_A}}}off", x=str(x), y=str(y))
-    ET.SubElement(xfrm, f"{{{NAMESPACE_A}}}ext", cx=str(cx), cy=str(cy))
-    prst_geom = ET.SubElement(sp_pr, f"{{{NAMESPACE_A}}}prstGeom", prst="rect")
-    ET.SubElement(prst_geom, f"{{{NAMESPACE_A}}}avLst")
-
-    return pic
 
 
-def add_audio_to_slide(
+def _link_audio_to_slide(
     work_path: Path,
     slide_path: str,
-    mp3_path: Path,
+    name: str,
+    mp3_filename: str,
+    icon_filename: str,
 ) -> None:
-    """Insert audio into an extracted slide workspace.
+    """Add relationships, picture and timing nodes for stored slide audio.
 
     Args:
         work_path: Extracted PPTX workspace root directory.
         slide_path: OOXML slide path (e.g. ppt/slides/slide1.xml).
-        mp3_path: Path to the MP3 audio file to insert.
-
-    Raises:
-        FileNotFoundError: If workspace directory or MP3 file does not exist.
-        SlideXmlNotFoundError: If the slide XML file does not exist.
+        name: Name attribute for the audio picture.
+        mp3_filename: Filename of the audio in ppt/media.
+        icon_filename: Filename of the icon in ppt/media.
     """
-    if not work_path.exists() or not work_path.is_dir():
-        raise FileNotFoundError(f"Workspace not found: {work_path}")
-
-    if not mp3_path.exists():
-        raise FileNotFoundError(f"MP3 file not found: {mp3_path}")
-
-    mp3_data = mp3_path.read_bytes()
-    mp3_hash = hashlib.sha256(mp3_data).hexdigest()
-
-    ET.register_namespace("p", NAMESPACE_P)
-    ET.register_namespace("a", NAMESPACE_A)
-    ET.register_namespace("p14", NAMESPACE_P14)
-    ET.register_namespace("a16", NAMESPACE_A16)
-
-    slide_file_path = work_path / slide_path
-
-    if not slide_file_path.exists():
-        raise SlideXmlNotFoundError(slide_path)
-
-    media_dir = work_path / "ppt/media"
-    media_dir.mkdir(parents=True, exist_ok=True)
-
-    existing_mp3s = _find_media_files(media_dir, "media", "mp3")
-    existing_pngs = _find_media_files(media_dir, "image", "png")
-
-    mp3_filename = _find_existing_media_by_hash(media_dir, existing_mp3s, mp3_hash)
-    icon_filename = _find_existing_media_by_hash(
-        media_dir,
-        existing_pngs,
-        AUDIO_ICON_HASH,
-    )
-
-    if mp3_filename is None:
-        mp3_filename = _next_media_filename(existing_mp3s, "media", "mp3")
-        (media_dir / mp3_filename).write_bytes(mp3_data)
-
-    if icon_filename is None:
-        icon_filename = _next_media_filename(existing_pngs, "image", "png")
-        (media_dir / icon_filename).write_bytes(AUDIO_ICON_BYTES)
-
-    ensure_content_type_defaults(
-        work_path,
-        {("mp3", "audio/mpeg"), ("png", "image/png")},
-    )
-
     rels_path = slide_rels_path(work_path, slide_path)
     rels_path.parent.mkdir(parents=True, exist_ok=True)
 
     if rels_path.exists():
-        rels_root = ET.fromstring(rels_path.read_bytes())
+        rels_root = ET.parse(rels_path).getroot()
     else:
         rels_root = ET.Element(f"{{{NAMESPACE_RELS}}}Relationships")
 
@@ -296,45 +258,132 @@ def add_audio_to_slide(
         icon_target,
     )
 
+    rels_changed = False
+
     if media_rid is None:
         media_rid = add_relationship(rels_root, REL_TYPE_MEDIA, media_target)
+        rels_changed = True
 
     if audio_rid is None:
         audio_rid = add_relationship(rels_root, REL_TYPE_AUDIO, media_target)
+        rels_changed = True
 
     if image_rid is None:
         image_rid = add_relationship(rels_root, REL_TYPE_IMAGE, icon_target)
+        rels_changed = True
 
-    ET.register_namespace("", NAMESPACE_RELS)
-    rels_path.write_bytes(
-        ET.tostring(rels_root, encoding="UTF-8", xml_declaration=True)
-    )
+    if rels_changed:
+        ET.register_namespace("", NAMESPACE_RELS)
+        ET.ElementTree(rels_root).write(
+            rels_path, encoding="UTF-8", xml_declaration=True
+        )
 
-    slide_root = ET.fromstring(slide_file_path.read_bytes())
-    spid = get_next_shape_id(slide_root)
+    slide_file_path = work_path / slide_path
+    slide_root = ET.parse(slide_file_path).getroot()
+    max_shape_id, max_ctn_id = scan_slide_ids(slide_root)
+    spid = max_shape_id + 1
+    timing_ids = TimingIdAllocator(max_ctn_id)
 
     sp_tree = get_or_create_pic_parent(slide_root)
     pic = _create_pic_element(
         spid=spid,
-        name=mp3_path.stem,
+        name=name,
         media_rid=media_rid,
         audio_rid=audio_rid,
         image_rid=image_rid,
     )
     sp_tree.append(pic)
 
-    cmd_parent = get_or_create_command_parent(slide_root)
-    audio_parent = get_or_create_audio_parent(slide_root)
+    cmd_parent = get_or_create_command_parent(slide_root, timing_ids)
+    audio_parent = get_or_create_audio_parent(slide_root, timing_ids)
 
-    cmd_base_id = get_next_timing_id(slide_root)
+    # Command node uses three consecutive cTn IDs
+    cmd_base_id = timing_ids.allocate(3)
     delay = compute_next_delay(cmd_parent)
     cmd_node = create_command_node(spid, delay, cmd_base_id)
     cmd_parent.insert(0, cmd_node)
 
-    audio_ctn_id = get_next_timing_id(slide_root)
+    audio_ctn_id = timing_ids.allocate()
     audio_node = create_audio_node(spid, audio_ctn_id)
     audio_parent.insert(0, audio_node)
 
-    slide_file_path.write_bytes(
-        ET.tostring(slide_root, encoding="UTF-8", xml_declaration=True)
+    ET.ElementTree(slide_root).write(
+        slide_file_path, encoding="UTF-8", xml_declaration=True
     )
+
+
+def add_audio_to_slides(work_path: Path, entries: list[tuple[str, Path]]) -> None:
+    """Insert audio into multiple slides of an extracted workspace.
+
+    Media scanning and content type updates are shared across all entries.
+
+    Args:
+        work_path: Extracted PPTX workspace root directory.
+        entries: Pairs of OOXML slide path and MP3 path to insert.
+
+    Raises:
+        FileNotFoundError: If workspace directory or an MP3 file does not exist.
+        SlideXmlNotFoundError: If a slide XML file does not exist.
+    """
+    if not work_path.exists() or not work_path.is_dir():
+        raise FileNotFoundError(f"Workspace not found: {work_path}")
+
+    for slide_path, mp3_path in entries:
+        if not mp3_path.exists():
+            raise FileNotFoundError(f"MP3 file not found: {mp3_path}")
+
+        if not (work_path / slide_path).exists():
+            raise SlideXmlNotFoundError(slide_path)
+
+    if not entries:
+        return
+
+    media_dir = work_path / "ppt/media"
+    media_dir.mkdir(parents=True, exist_ok=True)
+
+    existing_mp3s = _scan_media_files(media_dir, MEDIA_MP3_PATTERN)
+    existing_pngs = _scan_media_files(media_dir, IMAGE_PNG_PATTERN)
+
+    icon_filename = _find_existing_media_by_hash(existing_pngs, AUDIO_ICON_HASH)
+
+    if icon_filename is None:
+        _, icon_filename = _next_media_filename(existing_pngs, "image", "png")
+        (media_dir / icon_filename).write_bytes(AUDIO_ICON_BYTES)
+
+    ensure_content_type_defaults(
+        work_path,
+        {("mp3", "audio/mpeg"), ("png", "image/png")},
+    )
+
+    for slide_path, mp3_path in entries:
+        mp3_hash = _file_hash(mp3_path)
+        mp3_filename = _find_existing_media_by_hash(existing_mp3s, mp3_hash)
+
+        if mp3_filename is None:
+            mp3_num, mp3_filename = _next_media_filename(existing_mp3s, "media", "mp3")
+            shutil.copyfile(mp3_path, media_dir / mp3_filename)
+            # Record the new file so later entries can reuse or skip it
+            existing_mp3s[mp3_filename] = (mp3_num, mp3_hash)
+
+        _link_audio_to_slide(
+            work_path, slide_path, mp3_path.stem, mp3_filename, icon_filename
+        )
+
+
+def add_audio_to_slide(
+    work_path: Path,
+    slide_path: str,
+    mp3_path: Path,
+) -> None:
+    """Insert audio into an extracted slide workspace.
+
+    Args:
+        work_path: Extracted PPTX workspace root directory.
+        slide_path: OOXML slide path (e.g. ppt/slides/slide1.xml).
+        mp3_path: Path to the MP3 audio file to insert.
+
+    Raises:
+        FileNotFoundError: If workspace directory or MP3 file does not exist.
+        SlideXmlNotFoundError: If the slide XML file does not exist.
+    """
+    add_audio_to_slides(work_path, [(slide_path, mp3_path)])
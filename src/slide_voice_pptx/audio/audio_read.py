@@ -17,12 +17,16 @@ from ..xpath import (
 from .audio_model import Audio
 
 
-def load_slide_audio(work_dir: Path, slide_path: str) -> list[Audio]:
+def load_slide_audio(
+    work_dir: Path, slide_path: str, rels_root: ET.Element | None = None
+) -> list[Audio]:
     """Load audio entries from a slide and its relationship file.
 
     Args:
         work_dir: Extracted PPTX workspace root.
         slide_path: Slide OOXML path.
+        rels_root: Already parsed slide relationships; read from the
+            workspace when omitted.
 
     Returns:
         List of discovered audio entries.
@@ -35,7 +39,7 @@ def load_slide_audio(work_dir: Path, slide_path: str) -> list[Audio]:
     if not slide_file.exists():
         raise SlideXmlNotFoundError(slide_path)
 
-    slide_root = ET.fromstring(slide_file.read_bytes())
+    slide_root = ET.parse(slide_file).getroot()
     audio_entries: list[Audio] = []
     needed_rids: set[str] = set()
     entry_parts: list[tuple[str, int, str, str, str]] = []
@@ -84,10 +88,14 @@ def load_slide_audio(work_dir: Path, slide_path: str) -> list[Audio]:
         )
 
     rels_targets: dict[str, str] = {}
-    rels_file = slide_rels_path(work_dir, slide_path)
 
-    if needed_rids and rels_file.exists():
-        rels_root = ET.fromstring(rels_file.read_bytes())
+    if needed_rids and rels_root is None:
+        rels_file = slide_rels_path(work_dir, slide_path)
+
+        if rels_file.exists():
+            rels_root = ET.parse(rels_file).getroot()
+
+    if needed_rids and rels_root is not None:
         rels_targets = get_relationship_id_target_map(
             rels_root,
             only_ids=needed_rids,
@@ -1,66 +1,119 @@
 """Slide audio timing XML helpers."""
 
 import xml.etree.ElementTree as ET
+from dataclasses import dataclass
 
 from ..namespaces import NAMESPACE_P, NSMAP
 from ..xml_helper import ensure_child
-from ..xpath import (
-    XPATH_P_CNVPR_WITH_ID,
-    XPATH_P_CTN_WITH_ID,
-    XPATH_P_SPTGT_WITH_SPID,
-    XPATH_TIMING_CONDS_WITH_DELAY,
-)
+from ..xpath import XPATH_TIMING_CONDS_WITH_DELAY
 
 DEFAULT_VOLUME = 80000
 
+_COMMAND_NODE_TEMPLATE = (
+    f'<p:par xmlns:p="{NAMESPACE_P}">'
+    '<p:cTn id="{outer_id}" fill="hold">'
+    '<p:stCondLst><p:cond delay="{delay}"/></p:stCondLst>'
+    "<p:childTnLst><p:par>"
+    '<p:cTn id="{inner_id}" presetID="1" presetClass="mediacall" presetSubtype="0" '
+    'fill="hold" nodeType="afterEffect">'
+    '<p:stCondLst><p:cond delay="0"/></p:stCondLst>'
+    "<p:childTnLst>"
+    '<p:cmd type="call" cmd="playFrom(0.0)"><p:cBhvr>'
+    '<p:cTn id="{behavior_id}" dur="1" fill="hold"/>'
+    '<p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl>'
+    "</p:cBhvr></p:cmd>"
+    "</p:childTnLst>"
+    "</p:cTn>"
+    "</p:par></p:childTnLst>"
+    "</p:cTn>"
+    "</p:par>"
+)
+_AUDIO_NODE_TEMPLATE = (
+    f'<p:audio xmlns:p="{NAMESPACE_P}">'
+    '<p:cMediaNode vol="{volume}" showWhenStopped="0">'
+    '<p:cTn id="{timing_id}" fill="hold" display="0">'
+    '<p:stCondLst><p:cond delay="indefinite"/></p:stCondLst>'
+    "<p:endCondLst>"
+    '<p:cond evt="onStopAudio" delay="0"><p:tgtEl><p:sldTgt/></p:tgtEl></p:cond>'
+    "</p:endCondLst>"
+    "</p:cTn>"
+    '<p:tgtEl><p:spTgt spid="{spid}"/></p:tgtEl>'
+    "</p:cMediaNode>"
+    "</p:audio>"
+)
+
 
-def _get_max_shape_id(slide_root: ET.Element) -> int:
-    """Scan slide XML for maximum shape/target id values.
+def scan_slide_ids(slide_root: ET.Element) -> tuple[int, int]:
+    """Scan slide XML once for maximum shape and cTn id values.
+
+    Shape IDs are collected from `p:cNvPr/@id` and `p:spTgt/@spid`.
 
     Args:
         slide_root: Root element of the slide XML.
 
     Returns:
-        Maximum shape ID found, or 0 if none found.
+        Maximum shape ID and maximum cTn ID found, each 0 if none found.
     """
-    targets = [
-        (XPATH_P_CNVPR_WITH_ID, "id"),
-        (XPATH_P_SPTGT_WITH_SPID, "spid"),
-    ]
-    found_ids = [
-        int(elem.get(attr, ""))
-        for xpath, attr in targets
-        for elem in slide_root.findall(xpath, namespaces=NSMAP)
-    ]
+    c_nv_pr_tag = f"{{{NAMESPACE_P}}}cNvPr"
+    sp_tgt_tag = f"{{{NAMESPACE_P}}}spTgt"
+    c_tn_tag = f"{{{NAMESPACE_P}}}cTn"
+    max_shape_id = 0
+    max_ctn_id = 0
 
-    return max(found_ids, default=0)
+    for elem in slide_root.iter():
+        tag = elem.tag
 
+        if tag == c_tn_tag:
+            ctn_id = elem.get("id", "")
 
-def _get_max_ctn_id(slide_root: ET.Element) -> int:
-    """Scan slide timing nodes for maximum cTn id values.
+            if ctn_id.isdigit() and int(ctn_id) > max_ctn_id:
+                max_ctn_id = int(ctn_id)
 
-    Args:
-        slide_root: Root element of the slide XML.
+            continue
 
-    Returns:
-        Maximum cTn ID found, or 0 if none found.
-    """
-    ids = (
-        int(elem.get("id", ""))
-        for elem in slide_root.findall(XPATH_P_CTN_WITH_ID, namespaces=NSMAP)
-        if elem.get("id", "").isdigit()
-    )
+        if tag == c_nv_pr_tag:
+            shape_id = elem.get("id", "")
+        elif tag == sp_tgt_tag:
+            shape_id = elem.get("spid", "")
+        else:
+            continue
+
+        if shape_id.isdigit() and int(shape_id) > max_shape_id:
+            max_shape_id = int(shape_id)
+
+    return max_shape_id, max_ctn_id
+
+
+@dataclass(slots=True)
+class TimingIdAllocator:
+    """Allocates cTn IDs above the highest ID already used in a slide."""
+
+    last_id: int
 
-    return max(ids, default=0)
+    def allocate(self, count: int = 1) -> int:
+        """Reserve consecutive cTn IDs.
 
+        Args:
+            count: Number of IDs to reserve.
 
-def _get_common_timing_prefix(slide_root: ET.Element) -> ET.Element:
+        Returns:
+            First reserved ID.
+        """
+        first_id = self.last_id + 1
+        self.last_id += count
+        return first_id
+
+
+def _get_common_timing_prefix(
+    slide_root: ET.Element, timing_ids: TimingIdAllocator
+) -> ET.Element:
     """Ensure timing prefix exists and return the root childTnLst.
 
     Path: p:timing/p:tnLst/p:par/p:cTn/p:childTnLst
 
     Args:
         slide_root: Root element of the slide XML.
+        timing_ids: Allocator for IDs of created cTn nodes.
 
     Returns:
         The childTnLst element for appending audio nodes.
@@ -80,13 +133,14 @@ def _get_common_timing_prefix(slide_root: ET.Element) -> ET.Element:
     )
 
     if c_tn_root.get("id") is None:
-        max_id = _get_max_ctn_id(slide_root)
-        c_tn_root.set("id", str(max_id + 1))
+        c_tn_root.set("id", str(timing_ids.allocate()))
 
     return ensure_child(c_tn_root, f"{{{p}}}childTnLst", {})
 
 
-def get_or_create_command_parent(slide_root: ET.Element) -> ET.Element:
+def get_or_create_command_parent(
+    slide_root: ET.Element, timing_ids: TimingIdAllocator
+) -> ET.Element:
     """Find or create the childTnLst where command nodes should be appended.
 
     Path: p:timing/p:tnLst/p:par/p:cTn/p:childTnLst/
@@ -94,12 +148,13 @@ def get_or_create_command_parent(slide_root: ET.Element) -> ET.Element:
 
     Args:
         slide_root: Root element of the slide XML.
+        timing_ids: Allocator for IDs of created cTn nodes.
 
     Returns:
         The childTnLst element for appending command nodes.
     """
     p = NAMESPACE_P
-    root_child_tn_lst = _get_common_timing_prefix(slide_root)
+    root_child_tn_lst = _get_common_timing_prefix(slide_root, timing_ids)
 
     seq = ensure_child(
         root_child_tn_lst,
@@ -113,16 +168,14 @@ def get_or_create_command_parent(slide_root: ET.Element) -> ET.Element:
     )
 
     if c_tn_seq.get("id") is None:
-        max_id = _get_max_ctn_id(slide_root)
-        c_tn_seq.set("id", str(max_id + 1))
+        c_tn_seq.set("id", str(timing_ids.allocate()))
 
     child_tn_lst = ensure_child(c_tn_seq, f"{{{p}}}childTnLst", {})
     par = ensure_child(child_tn_lst, f"{{{p}}}par", {})
     c_tn_inner = ensure_child(par, f"{{{p}}}cTn", {"fill": "hold"})
 
     if c_tn_inner.get("id") is None:
-        max_id = _get_max_ctn_id(slide_root)
-        c_tn_inner.set("id", str(max_id + 1))
+        c_tn_inner.set("id", str(timing_ids.allocate()))
 
     st_cond_lst = ensure_child(c_tn_inner, f"{{{p}}}stCondLst", {})
     ensure_child(st_cond_lst, f"{{{p}}}cond", {"delay": "indefinite"})
@@ -156,18 +209,21 @@ def get_or_create_command_parent(slide_root: ET.Element) -> ET.Element:
     return command_parent
 
 
-def get_or_create_audio_parent(slide_root: ET.Element) -> ET.Element:
+def get_or_create_audio_parent(
+    slide_root: ET.Element, timing_ids: TimingIdAllocator
+) -> ET.Element:
     """Find or create the childTnLst where audio nodes should be appended.
 
     Path: p:timing/p:tnLst/p:par/p:cTn/p:childTnLst
 
     Args:
         slide_root: Root element of the slide XML.
+        timing_ids: Allocator for IDs of created cTn nodes.
 
     Returns:
         The childTnLst element for appending audio nodes.
     """
-    return _get_common_timing_prefix(slide_root)
+    return _get_common_timing_prefix(slide_root, timing_ids)
 
 
 def get_or_create_pic_parent(slide_root: ET.Element) -> ET.Element:
@@ -219,51 +275,16 @@ def create_command_node(spid: int, delay: int, base_id: int) -> ET.Element:
     Returns:
         The created command node element.
     """
-    p = NAMESPACE_P
-
-    par = ET.Element(f"{{{p}}}par")
-    c_tn_outer = ET.SubElement(par, f"{{{p}}}cTn", id=str(base_id), fill="hold")
-
-    st_cond_lst = ET.SubElement(c_tn_outer, f"{{{p}}}stCondLst")
-    ET.SubElement(st_cond_lst, f"{{{p}}}cond", delay=str(delay))
-
-    child_tn_lst = ET.SubElement(c_tn_outer, f"{{{p}}}childTnLst")
-    inner_par = ET.SubElement(child_tn_lst, f"{{{p}}}par")
-    c_tn_inner = ET.SubElement(
-        inner_par,
-        f"{{{p}}}cTn",
-        id=str(base_id + 1),
-        presetID="1",
-        presetClass="mediacall",
-        presetSubtype="0",
-        fill="hold",
-        nodeType="afterEffect",
+    return ET.fromstring(
+        _COMMAND_NODE_TEMPLATE.format(
+            spid=spid,
+            delay=delay,
+            outer_id=base_id,
+            inner_id=base_id + 1,
+            behavior_id=base_id + 2,
+        )
     )
 
-    st_cond_lst_inner = ET.SubElement(c_tn_inner, f"{{{p}}}stCondLst")
-    ET.SubElement(st_cond_lst_inner, f"{{{p}}}cond", delay="0")
-
-    child_tn_lst_inner = ET.SubElement(c_tn_inner, f"{{{p}}}childTnLst")
-    cmd = ET.SubElement(
-        child_tn_lst_inner,
-        f"{{{p}}}cmd",
-        type="call",
-        cmd="playFrom(0.0)",
-    )
-
-    c_bhvr = ET.SubElement(cmd, f"{{{p}}}cBhvr")
-    ET.SubElement(
-        c_bhvr,
-        f"{{{p}}}cTn",
-        id=str(base_id + 2),
-        dur="1",
-        fill="hold",
-    )
-    tgt_el = ET.SubElement(c_bhvr, f"{{{p}}}tgtEl")
-    ET.SubElement(tgt_el, f"{{{p}}}spTgt", spid=str(spid))
-
-    return par
-
 
 def create_audio_node(
     spid: int,
@@ -280,57 +301,6 @@ def create_audio_node(
     Returns:
         The created audio node element.
     """
-    p = NAMESPACE_P
-
-    audio = ET.Element(f"{{{p}}}audio")
-    c_media_node = ET.SubElement(
-        audio,
-        f"{{{p}}}cMediaNode",
-        vol=str(volume),
-        showWhenStopped="0",
-    )
-
-    c_tn = ET.SubElement(
-        c_media_node,
-        f"{{{p}}}cTn",
-        id=str(timing_id),
-        fill="hold",
-        display="0",
+    return ET.fromstring(
+        _AUDIO_NODE_TEMPLATE.format(spid=spid, timing_id=timing_id, volume=volume)
     )
-
-    st_cond_lst = ET.SubElement(c_tn, f"{{{p}}}stCondLst")
-    ET.SubElement(st_cond_lst, f"{{{p}}}cond", delay="indefinite")
-
-    end_cond_lst = ET.SubElement(c_tn, f"{{{p}}}endCondLst")
-    cond = ET.SubElement(end_cond_lst, f"{{{p}}}cond", evt="onStopAudio", delay="0")
-    tgt_el = ET.SubElement(cond, f"{{{p}}}tgtEl")
-    ET.SubElement(tgt_el, f"{{{p}}}sldTgt")
-
-    tgt_el_2 = ET.SubElement(c_media_node, f"{{{p}}}tgtEl")
-    ET.SubElement(tgt_el_2, f"{{{p}}}spTgt", spid=str(spid))
-
-    return audio
-
-
-def get_next_shape_id(slide_root: ET.Element) -> int:
-    """Get next available shape id from slide content.
-
-    Args:
-        slide_root: Root element of the slide XML.
-
-    Returns:
-        Next available shape ID.
-    """
-    return _get_max_shape_id(slide_root) + 1
-
-
-def get_next_timing_id(slide_root: ET.Element) -> int:
-    """Get next available timing id from slide timing nodes.
-
-    Args:
-        slide_root: Root element of the slide XML.
-
-    Returns:
-        Next available timing node ID.
-    """
-    return _get_max_ctn_id(slide_root) + 1
@@ -3,11 +3,10 @@
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
-from .namespaces import NAMESPACE_CT, NSMAP_CT
-from .xpath import (
-    XPATH_CT_DEFAULT_BY_EXTENSION,
-    XPATH_CT_OVERRIDE_BY_PATH_NAME,
-)
+from .namespaces import NAMESPACE_CT
+
+_DEFAULT_TAG = f"{{{NAMESPACE_CT}}}Default"
+_OVERRIDE_TAG = f"{{{NAMESPACE_CT}}}Override"
 
 
 def _read_content_types_root(work_dir: Path) -> ET.Element:
@@ -19,7 +18,7 @@ def _read_content_types_root(work_dir: Path) -> ET.Element:
     Returns:
         Parsed root element for `[Content_Types].xml`.
     """
-    return ET.fromstring((work_dir / "[Content_Types].xml").read_bytes())
+    return ET.parse(work_dir / "[Content_Types].xml").getroot()
 
 
 def _write_content_types_root(work_dir: Path, root: ET.Element) -> None:
@@ -30,61 +29,8 @@ def _write_content_types_root(work_dir: Path, root: ET.Element) -> None:
         root: Parsed `[Content_Types].xml` root element to write.
     """
     ET.register_namespace("", NAMESPACE_CT)
-    (work_dir / "[Content_Types].xml").write_bytes(
-        ET.tostring(root, encoding="UTF-8", xml_declaration=True)
-    )
-
-
-def _ensure_content_type_default(
-    root: ET.Element, extension: str, content_type: str
-) -> None:
-    """Add a Default entry to `[Content_Types].xml` if not present.
-
-    Args:
-        root: Parsed `[Content_Types].xml` root element.
-        extension: File extension without a leading dot.
-        content_type: MIME content type for the extension.
-    """
-    if (
-        root.find(
-            XPATH_CT_DEFAULT_BY_EXTENSION.format(extension=extension),
-            namespaces=NSMAP_CT,
-        )
-        is not None
-    ):
-        return
-
-    ET.SubElement(
-        root,
-        f"{{{NAMESPACE_CT}}}Default",
-        Extension=extension,
-        ContentType=content_type,
-    )
-
-
-def _ensure_content_type_override(
-    root: ET.Element, path_name: str, content_type: str
-) -> None:
-    """Add an Override entry to `[Content_Types].xml` if not present.
-
-    Args:
-        root: Parsed `[Content_Types].xml` root element.
-        path_name: Package part name to match in the override entry.
-        content_type: MIME content type for the package part.
-    """
-    if (
-        root.find(
-            XPATH_CT_OVERRIDE_BY_PATH_NAME.format(path_name=path_name),
-            namespaces=NSMAP_CT,
-        )
-    ) is not None:
-        return
-
-    ET.SubElement(
-        root,
-        f"{{{NAMESPACE_CT}}}Override",
-        PartName=path_name,
-        ContentType=content_type,
+    ET.ElementTree(root).write(
+        work_dir / "[Content_Types].xml", encoding="UTF-8", xml_declaration=True
     )
 
 
@@ -94,16 +40,28 @@ def ensure_content_type_defaults(
 ) -> None:
     """Ensure multiple Default entries exist in `[Content_Types].xml`.
 
+    The file is only rewritten when an entry was missing.
+
     Args:
         work_dir: Extracted PPTX workspace root.
         entries: Extension and content-type pairs to ensure as defaults.
     """
     root = _read_content_types_root(work_dir)
+    extensions = {default.get("Extension") for default in root.iterfind(_DEFAULT_TAG)}
+    changed = False
 
     for extension, content_type in entries:
-        _ensure_content_type_default(root, extension, content_type)
+        if extension in extensions:
+            continue
 
-    _write_content_types_root(work_dir, root)
+        ET.SubElement(
+            root, _DEFAULT_TAG, {"Extension": extension, "ContentType": content_type}
+        )
+        extensions.add(extension)
+        changed = True
+
+    if changed:
+        _write_content_types_root(work_dir, root)
 
 
 def ensure_content_type_overrides(
@@ -112,16 +70,28 @@ def ensure_content_type_overrides(
 ) -> None:
     """Ensure multiple Override entries exist in `[Content_Types].xml`.
 
+    The file is only rewritten when an entry was missing.
+
     Args:
         work_dir: Extracted PPTX workspace root.
         entries: Part-name and content-type pairs to ensure as overrides.
     """
     root = _read_content_types_root(work_dir)
+    path_names = {override.get("PartName") for override in root.iterfind(_OVERRIDE_TAG)}
+    changed = False
 
     for path_name, content_type in entries:
-        _ensure_content_type_override(root, path_name, content_type)
+        if path_name in path_names:
+            continue
+
+        ET.SubElement(
+            root, _OVERRIDE_TAG, {"PartName": path_name, "ContentType": content_type}
+        )
+        path_names.add(path_name)
+        changed = True
 
-    _write_content_types_root(work_dir, root)
+    if changed:
+        _write_content_types_root(work_dir, root)
 
 
 def remove_content_type_default_if_unused(
@@ -140,10 +110,9 @@ def remove_content_type_default_if_unused(
         return
 
     root = _read_content_types_root(work_dir)
-    default_tag = f"{{{NAMESPACE_CT}}}Default"
     removed = False
 
-    for default in list(root.findall(default_tag)):
+    for default in list(root.findall(_DEFAULT_TAG)):
         if default.get("Extension") != extension:
             continue
 
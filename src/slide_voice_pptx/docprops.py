@@ -2,10 +2,11 @@
 
 import xml.etree.ElementTree as ET
 from datetime import datetime, timezone
-from pathlib import Path
 
-from .namespaces import NAMESPACE_DCTERMS, NAMESPACE_XSI, REL_TYPE_NOTES_SLIDE
-from .rels import find_relationship_target_by_type
+from .namespaces import NAMESPACE_DCTERMS, NAMESPACE_XSI
+
+for _prefix, _uri in (("dcterms", NAMESPACE_DCTERMS), ("xsi", NAMESPACE_XSI)):
+    ET.register_namespace(_prefix, _uri)
 
 
 def update_core_xml_modified(core_content: bytes) -> bytes:
@@ -17,8 +18,6 @@ def update_core_xml_modified(core_content: bytes) -> bytes:
     Returns:
         Updated XML bytes.
     """
-    ET.register_namespace("dcterms", NAMESPACE_DCTERMS)
-    ET.register_namespace("xsi", NAMESPACE_XSI)
     root = ET.fromstring(core_content)
     modified = root.find(f"{{{NAMESPACE_DCTERMS}}}modified")
 
@@ -54,31 +53,3 @@ def update_app_xml_notes_count(app_content: bytes, notes_count: int) -> bytes:
     notes.text = str(notes_count)
 
     return ET.tostring(root, encoding="UTF-8", xml_declaration=True)
-
-
-def count_slides_with_notes(work_dir: Path) -> int:
-    """Count slides that reference a notesSlide relationship.
-
-    Args:
-        work_dir: Extracted PPTX workspace root.
-
-    Returns:
-        Number of slides with notes relationships.
-    """
-    rels_dir = work_dir / "ppt/slides/_rels"
-
-    if not rels_dir.exists():
-        return 0
-
-    count = 0
-
-    for rels_path in rels_dir.glob("slide*.xml.rels"):
-        rels_root = ET.fromstring(rels_path.read_bytes())
-
-        if (
-            find_relationship_target_by_type(rels_root, REL_TYPE_NOTES_SLIDE)
-            is not None
-        ):
-            count += 1
-
-    return count
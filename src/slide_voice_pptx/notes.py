@@ -1,6 +1,7 @@
 """Notes extraction and write support for PPTX slides."""
 
 import xml.etree.ElementTree as ET
+from collections.abc import Iterator
 from pathlib import Path
 
 from .content_types import ensure_content_type_overrides
@@ -35,8 +36,6 @@ from .xml_helper import ensure_child
 from .xpath import (
     XPATH_NOTES_BODY_SHAPES,
     XPATH_NOTES_MASTER_ID_WITH_RID,
-    XPATH_P_CNVPR_WITH_ID,
-    XPATH_PARAGRAPH_TEXT,
     XPATH_SHAPE_PARAGRAPHS,
     XPATH_TXBODY_PARAGRAPHS,
 )
@@ -52,31 +51,69 @@ CONTENT_TYPE_THEME = "application/vnd.openxmlformats-officedocument.theme+xml"
 NOTES_MASTER_PATH = "ppt/notesMasters/notesMaster1.xml"
 THEME2_PATH = "ppt/theme/theme2.xml"
 
+for _prefix, _uri in (("a", NAMESPACE_A), ("p", NAMESPACE_P), ("r", NAMESPACE_R)):
+    ET.register_namespace(_prefix, _uri)
+
+_A_BODY_PR = f"{{{NAMESPACE_A}}}bodyPr"
+_A_P = f"{{{NAMESPACE_A}}}p"
+_A_R = f"{{{NAMESPACE_A}}}r"
+_A_T = f"{{{NAMESPACE_A}}}t"
+_P_CNVPR = f"{{{NAMESPACE_P}}}cNvPr"
+_P_CSLD = f"{{{NAMESPACE_P}}}cSld"
+_P_SP_TREE = f"{{{NAMESPACE_P}}}spTree"
+_P_TX_BODY = f"{{{NAMESPACE_P}}}txBody"
+
+_GROUP_SHAPE_PROPERTIES_XML = (
+    "<p:nvGrpSpPr>"
+    '<p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/>'
+    "</p:nvGrpSpPr>"
+    "<p:grpSpPr/>"
+)
+_NOTES_BODY_SHAPE_TEMPLATE = (
+    f'<p:sp xmlns:p="{NAMESPACE_P}">'
+    "<p:nvSpPr>"
+    '<p:cNvPr id="{shape_id}" name="Notes Placeholder 2"/>'
+    "<p:cNvSpPr/>"
+    '<p:nvPr><p:ph type="body" idx="1"/></p:nvPr>'
+    "</p:nvSpPr>"
+    "<p:spPr/>"
+    "<p:txBody/>"
+    "</p:sp>"
+)
+_NOTES_SLIDE_TEMPLATE = (
+    f'<p:notes xmlns:p="{NAMESPACE_P}">'
+    f"<p:cSld><p:spTree>{_GROUP_SHAPE_PROPERTIES_XML}</p:spTree></p:cSld>"
+    "</p:notes>"
+)
+_NOTES_MASTER_TEMPLATE = (
+    f'<p:notesMaster xmlns:p="{NAMESPACE_P}">'
+    f"<p:cSld><p:spTree>{_GROUP_SHAPE_PROPERTIES_XML}</p:spTree></p:cSld>"
+    '<p:clrMap bg1="lt1" tx1="dk1" bg2="lt2" tx2="dk2" accent1="accent1" '
+    'accent2="accent2" accent3="accent3" accent4="accent4" accent5="accent5" '
+    'accent6="accent6" hlink="hlink" folHlink="folHlink"/>'
+    "</p:notesMaster>"
+)
+
 
-def _extract_paragraphs(shape_element: ET.Element) -> list[str]:
+def _extract_paragraphs(shape_element: ET.Element) -> Iterator[str]:
     """Extract paragraph texts from a shape element.
 
     Args:
         shape_element: Shape XML element containing text body.
 
-    Returns:
-        List of paragraph strings.
+    Yields:
+        Paragraph strings in document order.
     """
-    paragraphs = []
-    p_elements = shape_element.findall(XPATH_SHAPE_PARAGRAPHS, namespaces=NSMAP)
-
-    for p_elem in p_elements:
-        text_elements = p_elem.findall(XPATH_PARAGRAPH_TEXT, namespaces=NSMAP)
-        para_text = "".join((t.text or "") for t in text_elements)
-        paragraphs.append(para_text)
-
-    return paragraphs
+    for p_elem in shape_element.iterfind(XPATH_SHAPE_PARAGRAPHS, namespaces=NSMAP):
+        yield "".join((t.text or "") for t in p_elem.iter(_A_T))
 
 
 def extract_notes_text(notes_element: ET.Element) -> str:
     """Extract plain text from a notes slide XML element.
 
-    Finds the body placeholder shape and extracts all text content.
+    Finds the body placeholder shape and extracts all text content. A notes
+    slide has a single body placeholder, the same one `write_slides_notes`
+    updates, so the lookup stops at the first match.
 
     Args:
         notes_element: Parsed notesSlide XML element.
@@ -84,12 +121,12 @@ def extract_notes_text(notes_element: ET.Element) -> str:
     Returns:
         Plain text content of the notes, with paragraphs joined by newlines.
     """
-    paragraphs = []
+    body_shape = notes_element.find(XPATH_NOTES_BODY_SHAPES, namespaces=NSMAP)
 
-    for shape in notes_element.findall(XPATH_NOTES_BODY_SHAPES, namespaces=NSMAP):
-        paragraphs.extend(_extract_paragraphs(shape))
+    if body_shape is None:
+        return ""
 
-    return "\n".join(paragraphs)
+    return "\n".join(_extract_paragraphs(body_shape))
 
 
 def _next_shape_id(sp_tree: ET.Element) -> str:
@@ -103,12 +140,12 @@ def _next_shape_id(sp_tree: ET.Element) -> str:
     """
     return str(
         max(
-            [
+            (
                 int(shape_id)
-                for c_nv_pr in sp_tree.findall(XPATH_P_CNVPR_WITH_ID, namespaces=NSMAP)
+                for c_nv_pr in sp_tree.iter(_P_CNVPR)
                 if (shape_id := c_nv_pr.get("id")) and shape_id.isdigit()
-            ]
-            + [0]
+            ),
+            default=0,
         )
         + 1
     )
@@ -126,19 +163,8 @@ def _create_notes_body_placeholder_shape(
     Returns:
         Created `p:sp` body-placeholder shape element.
     """
-    body_shape = ET.SubElement(sp_tree, f"{{{NAMESPACE_P}}}sp")
-    nv_sp_pr = ET.SubElement(body_shape, f"{{{NAMESPACE_P}}}nvSpPr")
-    ET.SubElement(
-        nv_sp_pr,
-        f"{{{NAMESPACE_P}}}cNvPr",
-        id=shape_id,
-        name="Notes Placeholder 2",
-    )
-    ET.SubElement(nv_sp_pr, f"{{{NAMESPACE_P}}}cNvSpPr")
-    nv_pr = ET.SubElement(nv_sp_pr, f"{{{NAMESPACE_P}}}nvPr")
-    ET.SubElement(nv_pr, f"{{{NAMESPACE_P}}}ph", {"type": "body", "idx": "1"})
-    ET.SubElement(body_shape, f"{{{NAMESPACE_P}}}spPr")
-    ET.SubElement(body_shape, f"{{{NAMESPACE_P}}}txBody")
+    body_shape = ET.fromstring(_NOTES_BODY_SHAPE_TEMPLATE.format(shape_id=shape_id))
+    sp_tree.append(body_shape)
 
     return body_shape
 
@@ -152,8 +178,8 @@ def _ensure_notes_body_tx_body(notes_root: ET.Element) -> ET.Element:
     Returns:
         Existing or newly created `p:txBody` element.
     """
-    c_sld = ensure_child(notes_root, f"{{{NAMESPACE_P}}}cSld")
-    sp_tree = ensure_child(c_sld, f"{{{NAMESPACE_P}}}spTree")
+    c_sld = ensure_child(notes_root, _P_CSLD)
+    sp_tree = ensure_child(c_sld, _P_SP_TREE)
     body_shape = notes_root.find(XPATH_NOTES_BODY_SHAPES, namespaces=NSMAP)
 
     if body_shape is None:
@@ -161,7 +187,7 @@ def _ensure_notes_body_tx_body(notes_root: ET.Element) -> ET.Element:
             sp_tree, shape_id=_next_shape_id(sp_tree)
         )
 
-    return ensure_child(body_shape, f"{{{NAMESPACE_P}}}txBody")
+    return ensure_child(body_shape, _P_TX_BODY)
 
 
 def _set_notes_text(notes_root: ET.Element, text: str) -> None:
@@ -179,11 +205,11 @@ def _set_notes_text(notes_root: ET.Element, text: str) -> None:
     paragraphs = text.split("\n") if text else [""]
 
     for paragraph_text in paragraphs:
-        paragraph = ET.SubElement(tx_body, f"{{{NAMESPACE_A}}}p")
+        paragraph = ET.SubElement(tx_body, _A_P)
 
         if paragraph_text:
-            run = ET.SubElement(paragraph, f"{{{NAMESPACE_A}}}r")
-            ET.SubElement(run, f"{{{NAMESPACE_A}}}t").text = paragraph_text
+            run = ET.SubElement(paragraph, _A_R)
+            ET.SubElement(run, _A_T).text = paragraph_text
 
 
 def _create_notes_slide_xml(text: str) -> ET.Element:
@@ -195,19 +221,12 @@ def _create_notes_slide_xml(text: str) -> ET.Element:
     Returns:
         Notes slide root element.
     """
-    notes_root = ET.Element(f"{{{NAMESPACE_P}}}notes")
-    c_sld = ET.SubElement(notes_root, f"{{{NAMESPACE_P}}}cSld")
-    sp_tree = ET.SubElement(c_sld, f"{{{NAMESPACE_P}}}spTree")
-
-    nv_grp_sp_pr = ET.SubElement(sp_tree, f"{{{NAMESPACE_P}}}nvGrpSpPr")
-    ET.SubElement(nv_grp_sp_pr, f"{{{NAMESPACE_P}}}cNvPr", id="1", name="")
-    ET.SubElement(nv_grp_sp_pr, f"{{{NAMESPACE_P}}}cNvGrpSpPr")
-    ET.SubElement(nv_grp_sp_pr, f"{{{NAMESPACE_P}}}nvPr")
-    ET.SubElement(sp_tree, f"{{{NAMESPACE_P}}}grpSpPr")
+    notes_root = ET.fromstring(_NOTES_SLIDE_TEMPLATE)
+    sp_tree = notes_root[0][0]  # p:cSld/p:spTree
 
     _create_notes_body_placeholder_shape(sp_tree, shape_id="3")
     tx_body = _ensure_notes_body_tx_body(notes_root)
-    body_pr = ET.Element(f"{{{NAMESPACE_A}}}bodyPr")
+    body_pr = ET.Element(_A_BODY_PR)
     tx_body.insert(0, body_pr)
 
     _set_notes_text(notes_root, text)
@@ -229,47 +248,13 @@ def _notes_filename_for_slide(slide_path: str) -> str:
     return f"notesSlide{suffix}.xml"
 
 
-def _default_clr_map() -> dict[str, str]:
-    """Build default color mapping attributes for notes master.
-
-    Returns:
-        Attribute mapping for p:clrMap.
-    """
-    return {
-        "bg1": "lt1",
-        "tx1": "dk1",
-        "bg2": "lt2",
-        "tx2": "dk2",
-        "accent1": "accent1",
-        "accent2": "accent2",
-        "accent3": "accent3",
-        "accent4": "accent4",
-        "accent5": "accent5",
-        "accent6": "accent6",
-        "hlink": "hlink",
-        "folHlink": "folHlink",
-    }
-
-
 def _create_notes_master_xml() -> ET.Element:
     """Create a minimal notes master XML root.
 
     Returns:
         Notes master root element.
     """
-    root = ET.Element(f"{{{NAMESPACE_P}}}notesMaster")
-    c_sld = ET.SubElement(root, f"{{{NAMESPACE_P}}}cSld")
-    sp_tree = ET.SubElement(c_sld, f"{{{NAMESPACE_P}}}spTree")
-
-    nv_grp_sp_pr = ET.SubElement(sp_tree, f"{{{NAMESPACE_P}}}nvGrpSpPr")
-    ET.SubElement(nv_grp_sp_pr, f"{{{NAMESPACE_P}}}cNvPr", id="1", name="")
-    ET.SubElement(nv_grp_sp_pr, f"{{{NAMESPACE_P}}}cNvGrpSpPr")
-    ET.SubElement(nv_grp_sp_pr, f"{{{NAMESPACE_P}}}nvPr")
-    ET.SubElement(sp_tree, f"{{{NAMESPACE_P}}}grpSpPr")
-
-    ET.SubElement(root, f"{{{NAMESPACE_P}}}clrMap", _default_clr_map())
-
-    return root
+    return ET.fromstring(_NOTES_MASTER_TEMPLATE)
 
 
 def _create_theme2(work_dir: Path) -> None:
@@ -340,12 +325,12 @@ def _ensure_notes_master_files(work_dir: Path, notes_master_path: str) -> str:
 
     if not notes_master_file_path.exists():
         notes_master_root = _create_notes_master_xml()
-        notes_master_file_path.write_bytes(
-            ET.tostring(notes_master_root, encoding="UTF-8", xml_declaration=True)
+        ET.ElementTree(notes_master_root).write(
+            notes_master_file_path, encoding="UTF-8", xml_declaration=True
         )
 
     if notes_master_rels_path.exists():
-        notes_master_rels = ET.fromstring(notes_master_rels_path.read_bytes())
+        notes_master_rels = ET.parse(notes_master_rels_path).getroot()
     else:
         notes_master_rels = ET.Element(f"{{{NAMESPACE_RELS}}}Relationships")
 
@@ -359,8 +344,8 @@ def _ensure_notes_master_files(work_dir: Path, notes_master_path: str) -> str:
         add_relationship(notes_master_rels, REL_TYPE_THEME, theme_target)
         theme_path = THEME2_PATH
         ET.register_namespace("", NAMESPACE_RELS)
-        notes_master_rels_path.write_bytes(
-            ET.tostring(notes_master_rels, encoding="UTF-8", xml_declaration=True)
+        ET.ElementTree(notes_master_rels).write(
+            notes_master_rels_path, encoding="UTF-8", xml_declaration=True
         )
 
     return theme_path
@@ -409,7 +394,7 @@ def _ensure_notes_master(work_dir: Path) -> str:
             relationship entry in presentation relationships.
     """
     presentation_path = work_dir / "ppt/presentation.xml"
-    presentation_root = ET.fromstring(presentation_path.read_bytes())
+    presentation_root = ET.parse(presentation_path).getroot()
     presentation_rels_path = work_dir / "ppt/_rels/presentation.xml.rels"
     presentation_rels = read_rels_path(presentation_rels_path)
     notes_master_rels = get_relationship_id_target_map(
@@ -442,13 +427,13 @@ def _ensure_notes_master(work_dir: Path) -> str:
                 presentation_rels, REL_TYPE_NOTES_MASTER, notes_master_target
             )
             ET.register_namespace("", NAMESPACE_RELS)
-            presentation_rels_path.write_bytes(
-                ET.tostring(presentation_rels, encoding="UTF-8", xml_declaration=True)
+            ET.ElementTree(presentation_rels).write(
+                presentation_rels_path, encoding="UTF-8", xml_declaration=True
             )
 
         _append_notes_master_id(presentation_root, notes_master_rid)
-        presentation_path.write_bytes(
-            ET.tostring(presentation_root, encoding="UTF-8", xml_declaration=True)
+        ET.ElementTree(presentation_root).write(
+            presentation_path, encoding="UTF-8", xml_declaration=True
         )
 
     notes_master_path = resolve_target_path("ppt/presentation.xml", notes_master_target)
@@ -465,49 +450,25 @@ def _ensure_notes_master(work_dir: Path) -> str:
     return notes_master_path
 
 
-def write_slide_notes(work_dir: Path, slide_path: str, text: str) -> None:
-    """Write notes text for a slide, creating notes files if needed.
+def _create_slide_notes(
+    work_dir: Path,
+    slide_path: str,
+    slide_rels: ET.Element,
+    text: str,
+    notes_master_path: str,
+) -> str:
+    """Create a notes slide part and link it to its slide and notes master.
 
     Args:
         work_dir: Extracted PPTX workspace root directory.
         slide_path: OOXML path (for example: ppt/slides/slide1.xml).
+        slide_rels: Parsed slide relationships, updated and written back.
         text: Plain notes text where paragraphs are separated by newlines.
+        notes_master_path: Notes master package path.
 
-    Raises:
-        RelationshipTargetNotFoundError: If a relationship target path resolves
-            to a missing notes XML file.
-        InvalidPptxError: If `ppt/theme/theme1.xml` is missing.
-        RelationshipIdNotFoundError: If `notesMasterId/@r:id` has no matching
-            relationship entry in presentation relationships.
-        RelsNotFoundError: If a required slide, presentation, or notes-master
-            relationship file is missing.
+    Returns:
+        Package path of the created notes slide.
     """
-    ET.register_namespace("a", NAMESPACE_A)
-    ET.register_namespace("p", NAMESPACE_P)
-    ET.register_namespace("r", NAMESPACE_R)
-
-    rels_path = slide_rels_path(work_dir, slide_path)
-    slide_rels = read_rels_path(rels_path)
-
-    if notes_target := find_relationship_target_by_type(
-        slide_rels, REL_TYPE_NOTES_SLIDE
-    ):
-        notes_xml_path = resolve_target_path(slide_path, notes_target)
-        notes_path = work_dir / notes_xml_path
-
-        if not notes_path.exists():
-            raise RelationshipTargetNotFoundError(
-                rels_path_for_path(slide_path), notes_xml_path
-            )
-
-        notes_root = ET.fromstring(notes_path.read_bytes())
-        _set_notes_text(notes_root, text)
-        notes_path.write_bytes(
-            ET.tostring(notes_root, encoding="UTF-8", xml_declaration=True)
-        )
-        return
-
-    notes_master_path = _ensure_notes_master(work_dir)
     notes_filename = _notes_filename_for_slide(slide_path)
     notes_xml_path = f"ppt/notesSlides/{notes_filename}"
     notes_rels_path = work_dir / "ppt/notesSlides/_rels" / f"{notes_filename}.rels"
@@ -517,9 +478,7 @@ def write_slide_notes(work_dir: Path, slide_path: str, text: str) -> None:
     notes_rels_path.parent.mkdir(parents=True, exist_ok=True)
 
     notes_root = _create_notes_slide_xml(text)
-    notes_path.write_bytes(
-        ET.tostring(notes_root, encoding="UTF-8", xml_declaration=True)
-    )
+    ET.ElementTree(notes_root).write(notes_path, encoding="UTF-8", xml_declaration=True)
 
     notes_rels_root = ET.Element(f"{{{NAMESPACE_RELS}}}Relationships")
     notes_master_target = relative_target_path(notes_xml_path, notes_master_path)
@@ -531,20 +490,75 @@ def write_slide_notes(work_dir: Path, slide_path: str, text: str) -> None:
         slide_target,
     )
     ET.register_namespace("", NAMESPACE_RELS)
-    notes_rels_path.write_bytes(
-        ET.tostring(notes_rels_root, encoding="UTF-8", xml_declaration=True)
+    ET.ElementTree(notes_rels_root).write(
+        notes_rels_path, encoding="UTF-8", xml_declaration=True
     )
 
     notes_target_from_slide = relative_target_path(slide_path, notes_xml_path)
     add_relationship(slide_rels, REL_TYPE_NOTES_SLIDE, notes_target_from_slide)
-    rels_path.write_bytes(
-        ET.tostring(slide_rels, encoding="UTF-8", xml_declaration=True)
+    ET.ElementTree(slide_rels).write(
+        slide_rels_path(work_dir, slide_path),
+        encoding="UTF-8",
+        xml_declaration=True,
     )
 
-    ensure_content_type_overrides(
-        work_dir,
-        {
-            (f"/ppt/notesSlides/{notes_filename}", CONTENT_TYPE_NOTES_SLIDE),
-            (f"/{notes_master_path}", CONTENT_TYPE_NOTES_MASTER),
-        },
-    )
+    return notes_xml_path
+
+
+def write_slides_notes(work_dir: Path, entries: list[tuple[str, str]]) -> None:
+    """Write notes text for multiple slides, creating notes files if needed.
+
+    The notes master and `[Content_Types].xml` are updated once per call.
+
+    Args:
+        work_dir: Extracted PPTX workspace root directory.
+        entries: Pairs of OOXML slide path and plain notes text, where
+            paragraphs are separated by newlines.
+
+    Raises:
+        RelationshipTargetNotFoundError: If a relationship target path resolves
+            to a missing notes XML file.
+        InvalidPptxError: If `ppt/theme/theme1.xml` is missing.
+        RelationshipIdNotFoundError: If `notesMasterId/@r:id` has no matching
+            relationship entry in presentation relationships.
+        RelsNotFoundError: If a required slide, presentation, or notes-master
+            relationship file is missing.
+    """
+    notes_master_path: str | None = None
+    created_notes_paths: list[str] = []
+
+    for slide_path, text in entries:
+        slide_rels = read_rels_path(slide_rels_path(work_dir, slide_path))
+
+        if notes_target := find_relationship_target_by_type(
+            slide_rels, REL_TYPE_NOTES_SLIDE
+        ):
+            notes_xml_path = resolve_target_path(slide_path, notes_target)
+            notes_path = work_dir / notes_xml_path
+
+            if not notes_path.exists():
+                raise RelationshipTargetNotFoundError(
+                    rels_path_for_path(slide_path), notes_xml_path
+                )
+
+            notes_root = ET.parse(notes_path).getroot()
+            _set_notes_text(notes_root, text)
+            ET.ElementTree(notes_root).write(
+                notes_path, encoding="UTF-8", xml_declaration=True
+            )
+            continue
+
+        if notes_master_path is None:
+            notes_master_path = _ensure_notes_master(work_dir)
+
+        created_notes_paths.append(
+            _create_slide_notes(
+                work_dir, slide_path, slide_rels, text, notes_master_path
+            )
+        )
+
+    if created_notes_paths:
+        ensure_content_type_overrides(
+            work_dir,
+            {(f"/{path}", CONTENT_TYPE_NOTES_SLIDE) for path in created_notes_paths},
+        )
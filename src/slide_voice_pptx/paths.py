@@ -1,11 +1,14 @@
 """Path helpers for PPTX OOXML package paths and relationships."""
 
 import posixpath
+from functools import lru_cache
 from pathlib import Path
 
 from .exceptions import RelsNotFoundError
 
 
+# Media cleanup resolves the same slide/target pairs once per slide rels file
+@lru_cache(maxsize=4096)
 def resolve_target_path(source_path: str, target: str) -> str:
     """Resolve a relationship target to a normalized package path.
 
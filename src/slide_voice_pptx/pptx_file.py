@@ -1,28 +1,45 @@
 """Central PPTX file model with slide-level operations."""
 
+import os
 import tempfile
 from pathlib import Path
 from typing import Self
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
-from .docprops import (
-    count_slides_with_notes,
-    update_app_xml_notes_count,
-    update_core_xml_modified,
-)
+from .docprops import update_app_xml_notes_count, update_core_xml_modified
 from .exceptions import (
     InvalidPptxError,
     SlideNotFoundError,
 )
 from .namespaces import REL_TYPE_SLIDE
+from .notes import write_slides_notes
 from .paths import resolve_target_path
 from .rels import get_relationships_target_by_type, read_rels_path
 from .slide import Slide
 
+# Already-compressed media gains nothing from DEFLATE, so it is stored as is
+STORED_MEDIA_SUFFIXES = frozenset(
+    {".mp3", ".m4a", ".mp4", ".png", ".jpg", ".jpeg", ".gif"}
+)
+
+
+def _slide_number(slide_path: str) -> int:
+    """Return the number in a slide part name like `ppt/slides/slide12.xml`.
+
+    Args:
+        slide_path: Slide OOXML path.
+
+    Returns:
+        Slide part number.
+    """
+    return int(slide_path.rpartition("slide")[2].removesuffix(".xml"))
+
 
 class PptxFile:
     """Central PPTX file class for notes and audio operations."""
 
+    __slots__ = ("_source_path", "_temp_dir", "_work_dir", "slides")
+
     def __init__(self, source_path: Path, temp_dir: tempfile.TemporaryDirectory[str]):
         """Initialize the PptxFile.
 
@@ -57,8 +74,13 @@ class PptxFile:
 
         try:
             with ZipFile(path, "r") as zip_file:
-                if "ppt/presentation.xml" not in zip_file.namelist():
-                    raise InvalidPptxError(str(path), "Missing ppt/presentation.xml")
+                # getinfo is a dict lookup; namelist would build a list to scan
+                try:
+                    zip_file.getinfo("ppt/presentation.xml")
+                except KeyError:
+                    raise InvalidPptxError(
+                        str(path), "Missing ppt/presentation.xml"
+                    ) from None
 
                 zip_file.extractall(Path(temp_dir.name) / "unpacked")
         except InvalidPptxError:
@@ -92,23 +114,20 @@ class PptxFile:
             RelsNotFoundError: If presentation relationships are missing.
         """
         rels = read_rels_path(self._work_dir / "ppt/_rels/presentation.xml.rels")
-        targets = get_relationships_target_by_type(rels, REL_TYPE_SLIDE)
-
-        indexed_paths: list[tuple[int, str]] = []
-
-        for target in targets:
-            slide_path = resolve_target_path("ppt/presentation.xml", target)
-            slide_num = int(slide_path.split("slide")[-1].replace(".xml", ""))
-            indexed_paths.append((slide_num, slide_path))
-
-        indexed_paths.sort(key=lambda item: item[0])
+        slide_paths = sorted(
+            (
+                resolve_target_path("ppt/presentation.xml", target)
+                for target in get_relationships_target_by_type(rels, REL_TYPE_SLIDE)
+            ),
+            key=_slide_number,
+        )
         self.slides = [
             Slide(
                 index=index,
                 slide_path=slide_path,
                 work_dir=self._work_dir,
             )
-            for index, (_, slide_path) in enumerate(indexed_paths)
+            for index, slide_path in enumerate(slide_paths)
         ]
 
     def _get_slide(self, slide_index: int) -> Slide:
@@ -192,8 +211,14 @@ class PptxFile:
         Args:
             output_path: Destination .pptx path.
         """
-        for slide in self.slides:
-            slide.save_notes()
+        changed_slides = [slide for slide in self.slides if slide.notes_changed]
+        write_slides_notes(
+            self._work_dir,
+            [(slide.slide_path, slide.notes) for slide in changed_slides],
+        )
+
+        for slide in changed_slides:
+            slide.mark_notes_saved()
 
         core_path = self._work_dir / "docProps/core.xml"
 
@@ -203,7 +228,8 @@ class PptxFile:
         core_path.write_bytes(update_core_xml_modified(core_path.read_bytes()))
 
         app_path = self._work_dir / "docProps/app.xml"
-        notes_count = count_slides_with_notes(self._work_dir)
+        # Slides track their notes part, so the slide rels need no re-parse here
+        notes_count = sum(slide.has_notes_slide for slide in self.slides)
 
         if not app_path.exists():
             raise InvalidPptxError(str(self._source_path), "Missing docProps/app.xml")
@@ -213,10 +239,21 @@ class PptxFile:
         )
 
         with ZipFile(output_path, "w", ZIP_DEFLATED) as zip_file:
-            for file_path in self._work_dir.rglob("*"):
-                if file_path.is_file():
-                    rel_name = file_path.relative_to(self._work_dir).as_posix()
-                    zip_file.write(file_path, rel_name)
+            # os.walk already separates files from directories, so no stat per entry
+            for dir_path, _, file_names in os.walk(self._work_dir):
+                rel_dir = os.path.relpath(dir_path, self._work_dir).replace(os.sep, "/")
+
+                for file_name in file_names:
+                    rel_name = file_name if rel_dir == "." else f"{rel_dir}/{file_name}"
+                    compress_type = (
+                        ZIP_STORED
+                        if os.path.splitext(file_name)[1].lower()
+                        in STORED_MEDIA_SUFFIXES
+                        else ZIP_DEFLATED
+                    )
+                    zip_file.write(
+                        os.path.join(dir_path, file_name), rel_name, compress_type
+                    )
 
     def close(self) -> None:
         """Cleanup temporary workspace."""
@@ -60,11 +60,13 @@ def read_rels(zip_file: ZipFile, rels_path: str) -> ET.Element:
         RelsNotFoundError: If the .rels file does not exist in the archive.
     """
     try:
-        content = zip_file.read(rels_path)
+        rels_file = zip_file.open(rels_path)
     except Exception as e:
         raise RelsNotFoundError(rels_path) from e
 
-    return ET.fromstring(content)
+    # Parse while decompressing instead of reading the whole member first
+    with rels_file:
+        return ET.parse(rels_file).getroot()
 
 
 def read_rels_path(rels_path: Path) -> ET.Element:
@@ -82,7 +84,7 @@ def read_rels_path(rels_path: Path) -> ET.Element:
     if not rels_path.exists():
         raise RelsNotFoundError(str(rels_path))
 
-    return ET.fromstring(rels_path.read_bytes())
+    return ET.parse(rels_path).getroot()
 
 
 def get_relationships_target_by_type(
@@ -156,15 +158,18 @@ def get_next_rid(rels_element: ET.Element) -> str:
     Returns:
         Next available rId.
     """
-    ids = [
-        int(rid)
-        for rel in rels_element.findall(
-            XPATH_RELATIONSHIP_WITH_ID,
-            namespaces=NSMAP_RELS,
-        )
-        if (id := rel.get("Id")) and id.startswith("rId") and (rid := id[3:]).isdigit()
-    ]
-    return f"rId{max(ids, default=0) + 1}"
+    highest = max(
+        (
+            int(rid)
+            for rel in rels_element.iterfind(
+                XPATH_RELATIONSHIP_WITH_ID,
+                namespaces=NSMAP_RELS,
+            )
+            if (id := rel.get("Id", "")).startswith("rId") and (rid := id[3:]).isdigit()
+        ),
+        default=0,
+    )
+    return f"rId{highest + 1}"
 
 
 def add_relationship(
@@ -187,12 +192,10 @@ def add_relationship(
     if rid is None:
         rid = get_next_rid(rels_element)
 
-    rel = ET.SubElement(
+    ET.SubElement(
         rels_element,
         f"{{{NAMESPACE_RELS}}}Relationship",
+        {"Id": rid, "Type": rel_type, "Target": target},
     )
-    rel.set("Id", rid)
-    rel.set("Type", rel_type)
-    rel.set("Target", target)
 
     return rid
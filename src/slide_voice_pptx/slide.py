@@ -9,7 +9,7 @@ from .audio.audio_delete import delete_slide_audio
 from .audio.audio_upsert import upsert_slide_audio
 from .exceptions import RelationshipTargetNotFoundError
 from .namespaces import REL_TYPE_NOTES_SLIDE
-from .notes import extract_notes_text, write_slide_notes
+from .notes import extract_notes_text
 from .paths import rels_path_for_path, resolve_target_path, slide_rels_path
 from .rels import find_relationship_target_by_type, read_rels_path
 
@@ -17,6 +17,16 @@ from .rels import find_relationship_target_by_type, read_rels_path
 class Slide:
     """Slide model backed by an extracted PPTX workspace."""
 
+    __slots__ = (
+        "_has_notes_slide",
+        "_notes",
+        "_notes_changed",
+        "_slide_path",
+        "_work_dir",
+        "audio",
+        "index",
+    )
+
     def __init__(
         self,
         index: int,
@@ -29,13 +39,24 @@ class Slide:
             index: Zero-based slide index.
             slide_path: OOXML path (e.g. ppt/slides/slide1.xml).
             work_dir: Extracted PPTX workspace directory.
+
+        Raises:
+            RelsNotFoundError: If the slide relationships file is missing.
         """
         self.index = index
         self._slide_path = slide_path
         self._work_dir = work_dir
-        self._notes = self._read_notes()
+        # Notes and audio both resolve through the slide rels, so parse it once
+        slide_rels = read_rels_path(slide_rels_path(work_dir, slide_path))
+        notes_target = find_relationship_target_by_type(
+            slide_rels, REL_TYPE_NOTES_SLIDE
+        )
+        self._has_notes_slide = notes_target is not None
+        self._notes = "" if notes_target is None else self._read_notes(notes_target)
         self._notes_changed = False
-        self.audio: list[Audio] = load_slide_audio(self._work_dir, self._slide_path)
+        self.audio: list[Audio] = load_slide_audio(
+            self._work_dir, self._slide_path, slide_rels
+        )
 
     @property
     def notes(self) -> str:
@@ -53,34 +74,41 @@ class Slide:
             self._notes = text
             self._notes_changed = True
 
-    def save_notes(self) -> None:
-        """Persist notes to workspace if slide notes were edited."""
-        if not self._notes_changed:
-            return
+    @property
+    def notes_changed(self) -> bool:
+        """Get whether in-memory notes were edited since the last save."""
+        return self._notes_changed
+
+    @property
+    def has_notes_slide(self) -> bool:
+        """Get whether this slide has a notes slide part in the workspace."""
+        return self._has_notes_slide
+
+    @property
+    def slide_path(self) -> str:
+        """Get the OOXML path of this slide."""
+        return self._slide_path
 
-        write_slide_notes(self._work_dir, self._slide_path, self._notes)
+    def mark_notes_saved(self) -> None:
+        """Mark in-memory notes as persisted to the workspace.
+
+        Writing notes creates the notes slide part when it did not exist yet.
+        """
         self._notes_changed = False
+        self._has_notes_slide = True
 
-    def _read_notes(self) -> str:
+    def _read_notes(self, notes_target: str) -> str:
         """Read notes text from extracted workspace files.
 
+        Args:
+            notes_target: Notes slide relationship target from the slide rels.
+
         Returns:
             Notes text as plain string.
 
         Raises:
             RelationshipTargetNotFoundError: If notes path target cannot be read.
         """
-        rels_path = slide_rels_path(self._work_dir, self._slide_path)
-        slide_rels = read_rels_path(rels_path)
-
-        if (
-            notes_target := find_relationship_target_by_type(
-                slide_rels,
-                REL_TYPE_NOTES_SLIDE,
-            )
-        ) is None:
-            return ""
-
         notes_xml_path = resolve_target_path(self._slide_path, notes_target)
         notes_path = self._work_dir / notes_xml_path
 
@@ -89,7 +117,7 @@ class Slide:
                 rels_path_for_path(self._slide_path), notes_xml_path
             )
 
-        notes_element = ET.fromstring(notes_path.read_bytes())
+        notes_element = ET.parse(notes_path).getroot()
         return extract_notes_text(notes_element)
 
     def _reload_audio(self) -> None:
@@ -20,16 +20,9 @@ def ensure_child(
     Returns:
         The existing or newly created child element.
     """
-    if not attrs:
-        child = parent.find(tag)
-
-        if child is not None:
-            return child
-    else:
-        predicates = "".join(f"[@{key}='{value}']" for key, value in attrs.items())
-        child = parent.find(f"{tag}{predicates}")
-
-        if child is not None:
+    # Compare attributes directly so values containing quotes need no escaping
+    for child in parent.iterfind(tag):
+        if not attrs or all(child.get(key) == value for key, value in attrs.items()):
             return child
 
     return ET.SubElement(parent, tag, attrs or {})
@@ -0,0 +1,78 @@
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from slide_voice_app.tts.google import MAX_SSML_BYTES, GoogleTTSProvider
+
+
+class _StubClient:
+    def __init__(self, release_first_after: int | None = None):
+        self.requests: list[str] = []
+        self._lock = threading.Lock()
+        self._release_first_after = release_first_after
+        self._release_first = threading.Event()
+
+    def synthesize_speech(self, input, voice, audio_config):
+        ssml_text = input.ssml
+
+        with self._lock:
+            self.requests.append(ssml_text)
+            request_count = len(self.requests)
+
+        if self._release_first_after is not None:
+            if request_count == self._release_first_after:
+                self._release_first.set()
+            elif ssml_text.startswith("<speak>a"):
+                # Hold the first chunk back so later chunks finish before it
+                assert self._release_first.wait(timeout=5)
+
+        return SimpleNamespace(audio_content=f"[{ssml_text[7]}]".encode())
+
+
+def _provider_with_client(client: _StubClient) -> GoogleTTSProvider:
+    provider = GoogleTTSProvider()
+    provider._client = client
+    return provider
+
+
+def test_generate_audio_splits_long_text_in_paragraph_order(tmp_path: Path) -> None:
+    paragraphs = [letter * 3000 for letter in "abc"]
+    client = _StubClient(release_first_after=len(paragraphs))
+    output_path = tmp_path / "out.mp3"
+
+    _provider_with_client(client).generate_audio(
+        "\n".join(paragraphs), "en-US-Wavenet-A", "en-US", output_path
+    )
+
+    assert sorted(client.requests) == [
+        f"<speak>{paragraph}</speak>" for paragraph in paragraphs
+    ]
+    assert all(len(ssml.encode()) <= MAX_SSML_BYTES for ssml in client.requests)
+    assert output_path.read_bytes() == b"[a][b][c]"
+
+
+def test_generate_audio_short_text_makes_one_request(tmp_path: Path) -> None:
+    client = _StubClient()
+    output_path = tmp_path / "out.mp3"
+
+    _provider_with_client(client).generate_audio(
+        "first line\nsecond line", "en-US-Wavenet-A", "en-US", output_path
+    )
+
+    assert client.requests == ["<speak>first line\nsecond line</speak>"]
+    assert output_path.read_bytes() == b"[f]"
+
+
+def test_generate_audio_rejects_oversize_paragraph(tmp_path: Path) -> None:
+    client = _StubClient()
+    output_path = tmp_path / "out.mp3"
+
+    with pytest.raises(ValueError, match="too long"):
+        _provider_with_client(client).generate_audio(
+            "short\n" + "x" * MAX_SSML_BYTES, "en-US-Wavenet-A", "en-US", output_path
+        )
+
+    assert client.requests == []
+    assert not output_path.exists()
@@ -6,6 +6,8 @@ from slide_voice_app.tts.ssml import SSMLProcessor
 @pytest.mark.parametrize(
     "input_text, expected",
     [
+        # Text without markup or XML special characters passes through
+        ("Plain text, no markup.\n", "<speak>Plain text, no markup.\n</speak>"),
         # Tilde next to words ignored, around spaces processed
         ("Hello~ ~~ ~World", '<speak>Hello~ <break time="1.0s"/> ~World</speak>'),
         # Tilde start/end of string
@@ -45,3 +47,20 @@ from slide_voice_app.tts.ssml import SSMLProcessor
 )
 def test_combined_rules(input_text, expected):
     assert SSMLProcessor.to_ssml(input_text) == expected
+
+
+def test_to_ssml_chunks_keeps_text_under_limit_in_one_document():
+    text = "[en-US-Wavenet-D]Hello ~\n_World_"
+
+    assert SSMLProcessor.to_ssml_chunks(text, 5000) == [SSMLProcessor.to_ssml(text)]
+
+
+def test_to_ssml_chunks_splits_between_paragraphs():
+    text = "One _two_\n[en-US-Wavenet-D]Three\nFour & five"
+    chunks = SSMLProcessor.to_ssml_chunks(text, 80)
+
+    assert chunks == [
+        '<speak>One <emphasis level="strong">two</emphasis></speak>',
+        '<speak><voice name="en-US-Wavenet-D">Three</voice>\nFour &amp; five</speak>',
+    ]
+    assert all(len(chunk.encode()) <= 80 for chunk in chunks)
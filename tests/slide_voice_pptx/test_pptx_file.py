@@ -1,8 +1,10 @@
+import shutil
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import cast
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
+from slide_voice_pptx.audio.audio_insert import add_audio_to_slides
 from slide_voice_pptx.namespaces import (
     NSMAP,
     NSMAP_CT,
@@ -14,8 +16,6 @@ from slide_voice_pptx.namespaces import (
 )
 from slide_voice_pptx.pptx_file import PptxFile
 from slide_voice_pptx.xpath import (
-    XPATH_CT_DEFAULT_BY_EXTENSION,
-    XPATH_CT_OVERRIDE_BY_PATH_NAME,
     XPATH_P_PIC,
     XPATH_P_TIMING,
     XPATH_PIC_AUDIO_FILE,
@@ -27,6 +27,8 @@ from slide_voice_pptx.xpath import (
 
 
 SAMPLES_DIR = Path(__file__).resolve().parents[1] / "data" / "pptx_samples"
+XPATH_CT_DEFAULT_BY_EXTENSION = "ct:Default[@Extension='{extension}']"
+XPATH_CT_OVERRIDE_BY_PATH_NAME = "ct:Override[@PartName='{path_name}']"
 
 
 def _fixture_pptx_path(tmp_path: Path, sample_name: str) -> Path:
@@ -190,6 +192,30 @@ def test_set_slide_notes_creates_notes_parts_and_updates_metadata(
     assert "ppt/theme/theme2.xml" in _zip_names(output_path)
 
 
+def test_set_slide_notes_on_every_slide_updates_existing_notes(
+    tmp_path: Path,
+) -> None:
+    input_path = _fixture_pptx_path(tmp_path, "notes")
+    output_path = tmp_path / "edited-notes.pptx"
+
+    with PptxFile.open(input_path) as pptx:
+        for index in range(pptx.slide_count):
+            pptx.set_slide_notes(index, f"Slide {index + 1}\nSecond line")
+
+        pptx.export_to(output_path)
+
+    with PptxFile.open(output_path) as exported:
+        assert [slide["notes"] for slide in exported.get_slides()] == [
+            f"Slide {index + 1}\nSecond line" for index in range(4)
+        ]
+
+    assert {
+        name
+        for name in _zip_names(output_path)
+        if name.startswith("ppt/notesSlides/notesSlide")
+    } == {f"ppt/notesSlides/notesSlide{index}.xml" for index in range(1, 5)}
+
+
 def test_save_audio_for_slide_creates_single_autoplay_audio(tmp_path: Path) -> None:
     input_path = _fixture_pptx_path(tmp_path, "base")
     output_path = tmp_path / "one-audio.pptx"
@@ -222,6 +248,21 @@ def test_save_audio_for_slide_creates_single_autoplay_audio(tmp_path: Path) -> N
     }
 
 
+def test_export_stores_media_and_deflates_xml(tmp_path: Path) -> None:
+    input_path = _fixture_pptx_path(tmp_path, "base")
+    output_path = tmp_path / "stored-media.pptx"
+    mp3_path = _write_mp3(tmp_path, "intro.mp3", b"intro-audio")
+
+    with PptxFile.open(input_path) as pptx:
+        pptx.save_audio_for_slide(0, mp3_path)
+        pptx.export_to(output_path)
+
+    with ZipFile(output_path) as zip_file:
+        assert zip_file.getinfo("ppt/media/media1.mp3").compress_type == ZIP_STORED
+        assert zip_file.getinfo("ppt/media/image1.png").compress_type == ZIP_STORED
+        assert zip_file.getinfo("ppt/slides/slide1.xml").compress_type == ZIP_DEFLATED
+
+
 def test_save_audio_for_slide_twice_keeps_two_autoplay_entries(tmp_path: Path) -> None:
     input_path = _fixture_pptx_path(tmp_path, "base")
     output_path = tmp_path / "two-audio.pptx"
@@ -252,6 +293,51 @@ def test_save_audio_for_slide_twice_keeps_two_autoplay_entries(tmp_path: Path) -
     }
 
 
+def test_add_audio_to_slides_reuses_media_within_batch(tmp_path: Path) -> None:
+    work_dir = tmp_path / "workspace"
+    shutil.copytree(SAMPLES_DIR / "notes", work_dir)
+    shared_mp3 = _write_mp3(tmp_path, "shared.mp3", b"shared-audio")
+    third_mp3 = _write_mp3(tmp_path, "third.mp3", b"third-audio")
+    fourth_mp3 = _write_mp3(tmp_path, "fourth.mp3", b"fourth-audio")
+
+    add_audio_to_slides(
+        work_dir,
+        [
+            ("ppt/slides/slide1.xml", shared_mp3),
+            ("ppt/slides/slide2.xml", shared_mp3),
+            ("ppt/slides/slide3.xml", third_mp3),
+            ("ppt/slides/slide4.xml", fourth_mp3),
+        ],
+    )
+
+    content_types_root = ET.parse(work_dir / "[Content_Types].xml").getroot()
+    expected_media = ["media1.mp3", "media1.mp3", "media2.mp3", "media3.mp3"]
+
+    for index, media_name in enumerate(expected_media, start=1):
+        slide_root = ET.parse(work_dir / f"ppt/slides/slide{index}.xml").getroot()
+        slide_rels_root = ET.parse(
+            work_dir / f"ppt/slides/_rels/slide{index}.xml.rels"
+        ).getroot()
+        targets_by_type = _relationship_targets_by_type(slide_rels_root)
+
+        assert len(_audio_entries(slide_root)) == 1
+        assert targets_by_type[REL_TYPE_AUDIO] == [f"../media/{media_name}"]
+        assert targets_by_type[REL_TYPE_MEDIA] == [f"../media/{media_name}"]
+        assert targets_by_type[REL_TYPE_IMAGE] == ["../media/image1.png"]
+
+    assert {path.name for path in (work_dir / "ppt/media").iterdir()} == {
+        "image1.png",
+        "media1.mp3",
+        "media2.mp3",
+        "media3.mp3",
+    }
+    assert (work_dir / "ppt/media/media1.mp3").read_bytes() == b"shared-audio"
+    assert (work_dir / "ppt/media/media2.mp3").read_bytes() == b"third-audio"
+    assert (work_dir / "ppt/media/media3.mp3").read_bytes() == b"fourth-audio"
+    assert _has_content_type_default(content_types_root, "mp3")
+    assert _has_content_type_default(content_types_root, "png")
+
+
 def test_delete_manual_from_two_manual_and_auto_audio_keeps_other_entries(
     tmp_path: Path,
 ) -> None: